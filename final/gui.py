@@ -13,11 +13,11 @@ SettingsDialog - configures the settings dialog and all its widgets.
 HelpDialog - configures the help dialog and all its widgets.
 SignalTracesPanel - configures the signal traces panel and all its widgets.
 SwitchesPanel - configures the switches panel and all its widgets.
+SwitchEntry - stores the drawing and state information of a single switch.
 """
 import os
-from io import StringIO
-from contextlib import redirect_stdout
-from collections import defaultdict
+import time
+from dataclasses import dataclass
 from pathlib import Path
 
 import wx
@@ -33,6 +33,61 @@ from scanner import Scanner
 from parse import Parser
 from canvas import MyGLCanvas
 
+# File types offered when uploading a logic description file
+_WILDCARD = "Text file (*.txt)|*.txt|All files (*.*)|*.*"
+
+# Colours of the switch state indicators (ON/OFF) and switch sliders
+_COL_ON = wx.Colour(4, 84, 14)
+_COL_OFF = wx.Colour(139, 26, 26)
+_COL_GREY = wx.Colour(112, 112, 112)
+
+# Indicator label, slider knob offset and indicator colour of each switch
+# state (the label is translated when drawn)
+_SWITCH_STATES = {
+    0: ("OFF", 0, _COL_OFF),
+    1: ("ON", 45, _COL_ON)}
+
+# Time in seconds spent running cycles between each update of the canvas
+# during a run
+_RUN_REFRESH_INTERVAL = 0.016
+
+# Languages offered in the settings dialog, in the order they are listed
+_LANGUAGES = {
+    "English (GB)": wx.LANGUAGE_ENGLISH,
+    "Español (ES)": wx.LANGUAGE_SPANISH,
+    "Ελληνικά (EL)": wx.LANGUAGE_GREEK}
+
+# Width of the widest switch state label, keyed by the translated labels
+_STATE_LABEL_WIDTHS = {}
+
+# Translated help dialog text, keyed by the name of the language it is in
+_HELP_TEXT = {}
+
+# Fonts already created by _font, keyed by their size, weight, face and family
+_FONTS = {}
+
+
+def _font(size, weight=wx.FONTWEIGHT_NORMAL, face="",
+          family=wx.FONTFAMILY_SWISS):
+    """Return the font with the given properties, creating it on first use.
+
+    Fonts are created lazily, as wx requires an App to exist first.
+    """
+    key = (size, weight, face, family)
+    font = _FONTS.get(key)
+    if font is None:
+        font = wx.Font(size, family, wx.FONTSTYLE_NORMAL, weight,
+                       faceName=face)
+        _FONTS[key] = font
+    return font
+
+
+def _styled_text(parent, label, font, style=0):
+    """Return a new static text with the given label, font and style."""
+    text = wx.StaticText(parent, wx.ID_ANY, label, style=style)
+    text.SetFont(font)
+    return text
+
 
 class Gui(wx.Frame):
     """Configure the main GUI window and all the widgets.
@@ -57,6 +112,8 @@ class Gui(wx.Frame):
     on_quit_button(self, event): Event handler for when the user clicks the QUIT button.
 
     extract_ldf_title(self): Returns the name of the logic description file supplied from the file path.
+
+    reset_state(self): Parses the logic description file again and resets all the panels to show the new network.
     """
 
     def __init__(
@@ -79,6 +136,10 @@ class Gui(wx.Frame):
         self.monitors = monitors
         self.first_init = first_init
 
+        # Only dump signal traces to the terminal when debugging, as the
+        # canvas already displays them
+        self.debug_print = os.environ.get("LOGSIM_DEBUG") == "1"
+
         # Extract the title of the LDF
         self.ldf_title = self.extract_ldf_title()
 
@@ -108,6 +169,10 @@ class Gui(wx.Frame):
         # Bind events to widgets
         self.Bind(wx.EVT_MENU, self.on_menu)
 
+        # Suppress repaints of the Frame and all its children until every
+        # panel has been built and laid out
+        self.Freeze()
+
         # Configure sizers for layout of Frame
         vbox = wx.BoxSizer(wx.VERTICAL)
         hbox = wx.BoxSizer(wx.HORIZONTAL)
@@ -141,6 +206,7 @@ class Gui(wx.Frame):
         self.SetSizeHints(1150 + self.switches_panel.text_width, 700)
 
         self.SetSizer(vbox)
+        self.Thaw()
 
         # Confirm first initialisation of the Gui and then show welcome dialog
         if self.first_init:
@@ -169,10 +235,48 @@ class Gui(wx.Frame):
 
     def extract_ldf_title(self):
         """Extract the name of the LDF file supplied from the file path."""
-        ldf_title = self.path.split(os.sep)[-1]
+        ldf_title = os.path.basename(self.path)
 
         return ldf_title
 
+    def reset_state(self):
+        """Parse the LDF again and reset all the panels to show the new network.
+
+        The existing panels are reused, rather than building a new Gui. If the
+        LDF no longer parses, its errors are shown and the current network is
+        kept.
+        """
+        names = Names()
+        devices = Devices(names)
+        network = Network(names, devices)
+        monitors = Monitors(names, devices, network)
+        scanner = Scanner(self.path, names)
+        parser = Parser(names, devices, network, monitors, scanner)
+
+        # Keep the current network if the LDF no longer parses, and display
+        # the informative error message
+        if not parser.parse_network():
+            output = "\n".join(parser.parse_errors)
+            error_dlg = ErrorDialog(self, output, size=(600, 400))
+
+            error_dlg.ShowModal()
+            error_dlg.Destroy()
+            return
+
+        # Point the Gui and all its panels at the new network
+        for window in (self, self.simulation_panel, self.signal_traces_panel,
+                       self.switches_panel):
+            window.names = names
+            window.devices = devices
+            window.network = network
+            window.monitors = monitors
+
+        self.Freeze()
+        self.simulation_panel.reset_run_button()
+        self.signal_traces_panel.reset_monitors()
+        self.switches_panel.reset_switches()
+        self.Thaw()
+
 
 class WelcomeDialog(wx.Dialog):
     """Configure the welcome dialog and all the widgets.
@@ -236,33 +340,27 @@ class WelcomeDialog(wx.Dialog):
         bottom_panel.SetSizer(bottom_panel_hbox)
 
         # Create and add widgets to the top panel of the Dialog box
-        welcome_text = wx.StaticText(
+        welcome_text = _styled_text(
             top_panel,
-            wx.ID_ANY,
             _("Welcome to our Logic Simulator!\n"),
+            _font(18),
             style=wx.ALIGN_CENTER)
-        welcome_font = wx.Font(18, wx.FONTFAMILY_SWISS,
-                               wx.FONTSTYLE_NORMAL, wx.FONTWEIGHT_NORMAL)
-        welcome_text.SetFont(welcome_font)
         top_panel_vbox.Add(welcome_text, 0, wx.ALIGN_CENTER)
 
         # Create and add widgets to the middle panel of the Dialog box
-        help_prompt_text = wx.StaticText(
-            middle_panel, wx.ID_ANY, _("Need some help?"))
-        middle_panel_font = wx.Font(10, wx.FONTFAMILY_SWISS,
-                                    wx.FONTSTYLE_NORMAL, wx.FONTWEIGHT_NORMAL)
-        help_prompt_text.SetFont(middle_panel_font)
+        help_prompt_text = _styled_text(
+            middle_panel, _("Need some help?"), _font(10))
         middle_panel_fgs.Add(help_prompt_text, 0, wx.ALIGN_LEFT)
 
         help_button = wx.Button(middle_panel, wx.ID_ANY, label=_("Tutorial"))
-        help_button.Bind(wx.EVT_BUTTON, self.on_help_button, help_button)
+        help_button.Bind(wx.EVT_BUTTON, self.on_help_button)
         help_button.SetToolTip(
             _("Click here to learn how to use our Logic Simulator"))
         middle_panel_fgs.Add(help_button, 1, flag=wx.EXPAND)
 
-        preloaded_ldf_text = wx.StaticText(
-            middle_panel, wx.ID_ANY, _("Pre-loaded\nLogic Description File: "))
-        preloaded_ldf_text.SetFont(middle_panel_font)
+        preloaded_ldf_text = _styled_text(
+            middle_panel, _("Pre-loaded\nLogic Description File: "),
+            _font(10))
         middle_panel_fgs.Add(preloaded_ldf_text, 0, wx.ALIGN_LEFT)
 
         preloaded_ldf_title = self.parent.ldf_title
@@ -274,9 +372,7 @@ class WelcomeDialog(wx.Dialog):
         upload_new_file_button = wx.Button(
             bottom_panel, wx.ID_ANY, label=_("Upload new file"))
         upload_new_file_button.Bind(
-            wx.EVT_BUTTON,
-            self.on_upload_new_file,
-            upload_new_file_button)
+            wx.EVT_BUTTON, self.on_upload_new_file)
         upload_new_file_button.SetToolTip(
             _("Upload a new Logic Description File"))
         bottom_panel_hbox.Add(upload_new_file_button, 1, flag=wx.EXPAND)
@@ -284,9 +380,7 @@ class WelcomeDialog(wx.Dialog):
         continue_button = wx.Button(
             bottom_panel, wx.ID_ANY, label=_("Continue"))
         continue_button.Bind(
-            wx.EVT_BUTTON,
-            self.on_continue_button,
-            continue_button)
+            wx.EVT_BUTTON, self.on_continue_button)
         continue_button.SetToolTip(
             _("Continue with preloaded logic description file"))
         bottom_panel_hbox.Add(continue_button, 1, flag=wx.EXPAND)
@@ -315,23 +409,22 @@ class WelcomeDialog(wx.Dialog):
 
     def on_upload_new_file(self, event):
         """Handle the event when the user clicks the upload new file button."""
-        dlg = wx.FileDialog(
+        file_path = None
+
+        # Show the dialog and retrieve the user response. If it is the OK response,
+        # process the data. The dialog is destroyed on leaving the with block.
+        with wx.FileDialog(
             self, message="Choose a file",
             defaultDir=os.getcwd(),
             defaultFile="",
-            wildcard="Text file (*.txt)|*.txt|All files (*.*)|*.*",
+            wildcard=_WILDCARD,
             style=wx.FD_OPEN |
             wx.FD_CHANGE_DIR | wx.FD_FILE_MUST_EXIST |
             wx.FD_PREVIEW
-        )
-
-        file_path = None
-
-        # Show the dialog and retrieve the user response. If it is the OK response,
-        # process the data.
-        if dlg.ShowModal() == wx.ID_OK:
-            # This returns a Python list of files that were selected.
-            file_path = dlg.GetPath()
+        ) as dlg:
+            if dlg.ShowModal() == wx.ID_OK:
+                # This returns a Python list of files that were selected.
+                file_path = dlg.GetPath()
 
         if file_path is not None:  # confirm a file has been selected from upload file dialog
             # Create new instance variables for the Gui class
@@ -342,15 +435,8 @@ class WelcomeDialog(wx.Dialog):
             scanner = Scanner(file_path, names)
             parser = Parser(names, devices, network, monitors, scanner)
 
-            # Capture any potential printed terminal outputs in case any
-            # parsing errors occur
-            captured_print = StringIO()
-            with redirect_stdout(captured_print):
-                # Parse the network
-                parsing_result = parser.parse_network()
-
-            # Store the potential printed terminal outputs
-            output = captured_print.getvalue()
+            # Parse the network
+            parsing_result = parser.parse_network()
 
             # If parsing was successful (i.e., no errors in LDF file)
             if parsing_result:
@@ -365,6 +451,7 @@ class WelcomeDialog(wx.Dialog):
                 self.Close()
                 self.parent.Close()
             else:  # display the informative error message
+                output = "\n".join(parser.parse_errors)
                 error_dlg = ErrorDialog(self, output, size=(600, 400))
 
                 error_dlg.ShowModal()
@@ -401,13 +488,19 @@ class RunSimulationPanel(wx.Panel):
 
     on_reset_button(self, event): Event handler when the user clicks the RESET button.
 
-    run_network(self, cycles): Run the logic circuit network for the specified number of cycles.
-                               Returns True if executing the network was successful.
-                               Returns False if executing the network was unsuccessful.
+    reset_run_button(self): Restores the RUN button to how it was before the simulation was first run.
+
+    run_network(self, cycles): Run the logic circuit network for the specified number of cycles, yielding after each
+                               cycle. Stops early if executing the network was unsuccessful.
+
+    run_next_cycles(self): Runs the next few cycles of the current run and updates the canvas.
 
     update_canvas(self): Updates the canvas with the data generated by running the network for the specified number of cycles.
 
-    on_spin(self, event): Event handler when the user clicks the spin button controls.
+    on_spin_debounced(self, event): Event handler when the user clicks the spin button controls.
+                                    Defers on_spin until the user stops clicking.
+
+    on_spin(self, event): Handles the spin button controls once the user stops clicking.
                           Returns None.
 
     on_upload_button(self, event): Event handler when the user clicks the UPLOAD button.
@@ -441,6 +534,13 @@ class RunSimulationPanel(wx.Panel):
         self.network = network
         self.monitors = monitors
         self.path = parent.path
+        self.upload_dialog = None
+        self.run_cycles = None
+
+        # The settings and help dialogs are created on first use only and
+        # are destroyed along with this panel
+        self.settings_dialog = None
+        self.help_dialog = None
 
         # Configure sizers for layout of RunSimulationPanel
         vbox = wx.BoxSizer(wx.VERTICAL)
@@ -464,13 +564,8 @@ class RunSimulationPanel(wx.Panel):
             1,
             flag=wx.EXPAND)
 
-        # Create and add centre padding of cycles + left buttons panel
-        self.cycles_and_left_buttons_panel_centre_padding = wx.Panel(
-            self.cycles_and_left_buttons_panel)
-        vbox.Add(
-            self.cycles_and_left_buttons_panel_centre_padding,
-            1,
-            flag=wx.EXPAND)
+        # Add centre padding of cycles + left buttons panel
+        vbox.AddStretchSpacer(1)
 
         # Create, set sizer and add bottom padding of cycles + left buttons
         # panel
@@ -495,18 +590,15 @@ class RunSimulationPanel(wx.Panel):
             self.cycles_panel, 1, flag=wx.TOP)
 
         # Create and add number of cycles text to cycles panel
-        str = _("NO. CYCLES")
-        text = wx.StaticText(self.cycles_panel, wx.ID_ANY,
-                             str, style=wx.ALIGN_LEFT)
-        font = wx.Font(15, wx.FONTFAMILY_SWISS,
-                       wx.FONTSTYLE_NORMAL, wx.FONTWEIGHT_NORMAL)
-        text.SetFont(font)
+        text = _styled_text(self.cycles_panel, _("NO. CYCLES"), _font(15),
+                            style=wx.ALIGN_LEFT)
         cycles_hbox.Add(text, 0, flag=wx.TOP | wx.LEFT)
         cycles_spin_control = wx.SpinCtrl(self.cycles_panel, -1, "", (30, 50))
         cycles_spin_control.SetRange(1, 100)
         cycles_spin_control.SetValue(5)
         self.cycles_spin_control = cycles_spin_control
-        self.Bind(wx.EVT_SPINCTRL, self.on_spin, self.cycles_spin_control)
+        self.spin_timer = None
+        self.cycles_spin_control.Bind(wx.EVT_SPINCTRL, self.on_spin_debounced)
         cycles_hbox.Add(self.cycles_spin_control, 0, flag=wx.LEFT, border=10)
 
         # Create, configure, set and add left buttons panel to overall cycles +
@@ -531,14 +623,7 @@ class RunSimulationPanel(wx.Panel):
         # Create, bind running simulation event to and add the "RUN" button
         self.run_button = wxbuttons.GenButton(
             self.run_button_panel, wx.ID_ANY, _("RUN"), name="run button")
-        self.Bind(wx.EVT_BUTTON, self.on_run_button, self.run_button)
-        self.run_button.SetFont(
-            wx.Font(
-                20,
-                wx.FONTFAMILY_SWISS,
-                wx.FONTSTYLE_NORMAL,
-                wx.FONTWEIGHT_BOLD,
-                False))
+        self.run_button.SetFont(_font(20, wx.FONTWEIGHT_BOLD))
         self.run_button.SetBezelWidth(5)
         self.run_button.SetMinSize(wx.DefaultSize)
         self.run_button.SetBackgroundColour(wx.Colour(4, 84, 14))
@@ -551,14 +636,7 @@ class RunSimulationPanel(wx.Panel):
         # button
         self.clear_button = wxbuttons.GenButton(
             self.left_buttons_panel, wx.ID_ANY, _("CLEAR"), name="clear button")
-        self.Bind(wx.EVT_BUTTON, self.on_clear_button, self.clear_button)
-        self.clear_button.SetFont(
-            wx.Font(
-                20,
-                wx.FONTFAMILY_SWISS,
-                wx.FONTSTYLE_NORMAL,
-                wx.FONTWEIGHT_BOLD,
-                False))
+        self.clear_button.SetFont(_font(20, wx.FONTWEIGHT_BOLD))
         self.clear_button.SetBezelWidth(5)
         self.clear_button.SetMinSize(wx.DefaultSize)
         self.clear_button.SetBackgroundColour(wx.Colour(0, 0, 205))
@@ -571,14 +649,7 @@ class RunSimulationPanel(wx.Panel):
         # button
         self.reset_button = wxbuttons.GenButton(
             self.left_buttons_panel, wx.ID_ANY, _("RESET"), name="reset button")
-        self.Bind(wx.EVT_BUTTON, self.on_reset_button, self.reset_button)
-        self.reset_button.SetFont(
-            wx.Font(
-                20,
-                wx.FONTFAMILY_SWISS,
-                wx.FONTSTYLE_NORMAL,
-                wx.FONTWEIGHT_BOLD,
-                False))
+        self.reset_button.SetFont(_font(20, wx.FONTWEIGHT_BOLD))
         self.reset_button.SetBezelWidth(5)
         self.reset_button.SetMinSize(wx.DefaultSize)
         self.reset_button.SetBackgroundColour(wx.Colour(205, 102, 29))
@@ -594,9 +665,8 @@ class RunSimulationPanel(wx.Panel):
         self.centre_panel.SetSizer(centre_panel_vbox)
         hbox.Add(self.centre_panel, 2, flag=wx.RIGHT | wx.EXPAND, border=10)
 
-        # Create and add top padding of centre panel
-        self.centre_panel_top_padding = wx.Panel(self.centre_panel)
-        centre_panel_vbox.Add(self.centre_panel_top_padding, 1, flag=wx.EXPAND)
+        # Add top padding of centre panel
+        centre_panel_vbox.AddStretchSpacer(1)
 
         # Create, set sizer and add bottom padding of centre panel
         self.centre_panel_bottom_padding = wx.Panel(self.centre_panel)
@@ -608,11 +678,8 @@ class RunSimulationPanel(wx.Panel):
             1,
             flag=wx.EXPAND)
 
-        # Create and add left panel to bottom padding of centre panel
-        self.centre_panel_bottom_padding_left = wx.Panel(
-            self.centre_panel_bottom_padding)
-        centre_panel_bottom_padding_hbox.Add(
-            self.centre_panel_bottom_padding_left, 1, flag=wx.EXPAND)
+        # Add left padding to bottom padding of centre panel
+        centre_panel_bottom_padding_hbox.AddStretchSpacer(1)
 
         # Create and add right panel to bottom padding of centre panel
         self.centre_panel_bottom_padding_right = wx.Panel(
@@ -629,14 +696,7 @@ class RunSimulationPanel(wx.Panel):
             wx.ID_ANY,
             _("QUIT"),
             name="quit button")
-        self.Bind(wx.EVT_BUTTON, parent.on_quit_button, self.quit_button)
-        self.quit_button.SetFont(
-            wx.Font(
-                20,
-                wx.FONTFAMILY_SWISS,
-                wx.FONTSTYLE_NORMAL,
-                wx.FONTWEIGHT_BOLD,
-                False))
+        self.quit_button.SetFont(_font(20, wx.FONTWEIGHT_BOLD))
         self.quit_button.SetBezelWidth(5)
         self.quit_button.SetMinSize(wx.DefaultSize)
         self.quit_button.SetBackgroundColour(wx.Colour(139, 26, 26))
@@ -663,7 +723,6 @@ class RunSimulationPanel(wx.Panel):
         # button
         self.upload_button = wx.Button(
             self.upload_button_panel, wx.ID_ANY, _("UPLOAD"))
-        self.Bind(wx.EVT_BUTTON, self.on_upload_button, self.upload_button)
         self.upload_button.SetToolTip(_("Upload logic description file"))
         upload_button_panel_vbox.Add(
             self.upload_button, 1, flag=wx.ALIGN_CENTER)
@@ -677,7 +736,6 @@ class RunSimulationPanel(wx.Panel):
         # Create, bind opening settings event to and add the "SETTINGS" button
         self.settings_button = wx.Button(
             self.settings_button_panel, wx.ID_ANY, _("SETTINGS"))
-        self.Bind(wx.EVT_BUTTON, self.on_settings_button, self.settings_button)
         self.settings_button.SetToolTip(_("Change system settings"))
         settings_button_panel_vbox.Add(
             self.settings_button, 1, flag=wx.ALIGN_CENTER)
@@ -692,7 +750,6 @@ class RunSimulationPanel(wx.Panel):
         # button
         self.help_button = wx.Button(
             self.help_button_panel, wx.ID_ANY, _("HELP"))
-        self.Bind(wx.EVT_BUTTON, self.on_help_button, self.help_button)
         self.help_button.SetToolTip(_("Help on running logic simulation"))
         help_button_panel_vbox.Add(self.help_button, 1, flag=wx.ALIGN_CENTER)
 
@@ -704,21 +761,43 @@ class RunSimulationPanel(wx.Panel):
         right_buttons_panel_hbox.Add(
             self.help_button_panel, 1, flag=wx.CENTER)
 
+        # Bind the button events in a single pass over the panel's buttons
+        buttons = [
+            (self.run_button, self.on_run_button),
+            (self.clear_button, self.on_clear_button),
+            (self.reset_button, self.on_reset_button),
+            (self.quit_button, parent.on_quit_button),
+            (self.upload_button, self.on_upload_button),
+            (self.settings_button, self.on_settings_button),
+            (self.help_button, self.on_help_button)]
+        for button, handler in buttons:
+            button.Bind(wx.EVT_BUTTON, handler)
+
         # Set sizer of RunSimulationPanel
         self.SetSizer(hbox)
 
+        # Paint the panel and its children through a single back buffer
+        self.SetDoubleBuffered(True)
+
     def on_run_button(self, event):
         """Handle the event when the user clicks the RUN/CONTINUE button."""
+        # Turn the RUN button into the CONTINUE button on the first run only,
+        # as re-laying out the panel is only needed when the label changes
         run_button_pressed = event.GetEventObject()
-        run_button_pressed.SetLabel(_("CONTINUE"))
-        run_button_pressed.SetBackgroundColour(wx.Colour(181, 150, 27))
-        run_button_pressed.SetToolTip(_("Continue running the simulation"))
-        self.GetSizer().Layout()
+        if run_button_pressed.GetLabel() != _("CONTINUE"):
+            run_button_pressed.SetLabel(_("CONTINUE"))
+            run_button_pressed.SetBackgroundColour(wx.Colour(181, 150, 27))
+            run_button_pressed.SetToolTip(
+                _("Continue running the simulation"))
+            self.GetSizer().Layout()
 
         no_of_cycles = self.cycles_spin_control.GetValue()
 
-        self.run_network(no_of_cycles)
-        self.update_canvas()
+        # Run the network a few cycles at a time from the event loop, so the
+        # GUI stays responsive and the canvas shows the traces as they grow
+        self.run_button.Disable()
+        self.run_cycles = self.run_network(no_of_cycles)
+        wx.CallAfter(self.run_next_cycles)
 
     def on_clear_button(self, event):
         """Handle the event when the user clicks the CLEAR button."""
@@ -726,46 +805,74 @@ class RunSimulationPanel(wx.Panel):
 
     def on_reset_button(self, event):
         """Handle the event when the user clicks the RESET button."""
-        # Recreate the same instance variables as the current Gui class
-        file_path = self.parent.path
-        names = Names()
-        devices = Devices(names)
-        network = Network(names, devices)
-        monitors = Monitors(names, devices, network)
-        scanner = Scanner(file_path, names)
-        parser = Parser(names, devices, network, monitors, scanner)
-        parser.parse_network()
-
-        new_Gui = Gui(file_path,
-                      names,
-                      devices,
-                      network,
-                      monitors,
-                      first_init=False,
-                      locale=self.parent.locale)
-        new_Gui.Show()
-        self.parent.Close()
+        self.parent.reset_state()
+
+    def reset_run_button(self):
+        """Restore the RUN button to how it was before the simulation was first run."""
+        self.run_button.SetLabel(_("RUN"))
+        self.run_button.SetBackgroundColour(wx.Colour(4, 84, 14))
+        self.run_button.SetToolTip(_("Begin running the simulation"))
+        self.GetSizer().Layout()
+
+        # Abandon any run still in progress
+        self.run_cycles = None
+        self.run_button.Enable()
 
     def run_network(self, cycles):
         """Run the logic network for the specificed number of cycles.
 
-        Return True if executing the network was successful.
-        Return False if executing the network was unsuccessful.
+        Yield after each cycle that was executed successfully. Stop early if
+        executing the network was unsuccessful.
         """
-        for _ in range(cycles):
+        for cycle in range(cycles):
             if self.network.execute_network():
                 self.monitors.record_signals()
             else:
                 print(_("Error! Network oscillating."))
-                return False
-        self.monitors.display_signals()
-        return True
+                return
+            yield cycle
+
+    def run_next_cycles(self):
+        """Run the next few cycles of the current run and update the canvas.
+
+        Run as many cycles as fit in the refresh interval, so fast networks
+        update the canvas once per interval rather than every few cycles.
+        Schedule itself again until every cycle of the run has been executed.
+        """
+        # Stop if the run was abandoned by a reset or the panel was destroyed
+        if self.run_cycles is None or not self:
+            return
+        deadline = time.perf_counter() + _RUN_REFRESH_INTERVAL
+        finished = True
+        for cycle in self.run_cycles:
+            if time.perf_counter() >= deadline:
+                finished = False
+                break
+        self.update_canvas()
+
+        if not finished:
+            wx.CallAfter(self.run_next_cycles)
+        else:
+            self.run_cycles = None
+            self.run_button.Enable()
+            if self.parent.debug_print:
+                self.monitors.display_signals()
 
     def update_canvas(self):
         """Update the canvas with the data generated from executing the network for a specified number of cycles."""
         self.signal_traces_panel.canvas.update_arguments(
             self.devices, self.monitors)
 
+    def on_spin_debounced(self, event):
+        """Handle the event when the user clicks the spin button controls.
+
+        Rapid clicks (or holding down an arrow) restart the timer, so on_spin
+        only runs once the user has stopped clicking for 150 ms.
+        """
+        if self.spin_timer is not None:
+            self.spin_timer.Stop()
+        self.spin_timer = wx.CallLater(150, self.on_spin, event.Clone())
+
     def on_spin(self, event):
         """Handle the event when the user clicks the spin button controls.
 
@@ -777,23 +884,26 @@ class RunSimulationPanel(wx.Panel):
 
     def on_upload_button(self, event):
         """Handle the event when the user clicks the upload button."""
-        dlg = wx.FileDialog(
-            self, message="Choose a file",
-            defaultDir=os.getcwd(),
-            defaultFile="",
-            wildcard="Text file (*.txt)|*.txt|All files (*.*)|*.*",
-            style=wx.FD_OPEN |
-            wx.FD_CHANGE_DIR | wx.FD_FILE_MUST_EXIST |
-            wx.FD_PREVIEW
-        )
+        # Create the file dialog on first use only and reuse it afterwards;
+        # it is destroyed along with this panel
+        if self.upload_dialog is None:
+            self.upload_dialog = wx.FileDialog(
+                self, message="Choose a file",
+                defaultDir=os.getcwd(),
+                defaultFile="",
+                wildcard=_WILDCARD,
+                style=wx.FD_OPEN |
+                wx.FD_CHANGE_DIR | wx.FD_FILE_MUST_EXIST |
+                wx.FD_PREVIEW
+            )
 
         file_path = None
 
         # Show the dialog and retrieve the user response. If it is the OK response,
         # process the data.
-        if dlg.ShowModal() == wx.ID_OK:
+        if self.upload_dialog.ShowModal() == wx.ID_OK:
             # This returns a Python list of files that were selected.
-            file_path = dlg.GetPath()
+            file_path = self.upload_dialog.GetPath()
 
         if file_path is not None:  # confirm a file has been selected from upload file dialog
             # Create new instance variables for the Gui class
@@ -804,15 +914,8 @@ class RunSimulationPanel(wx.Panel):
             scanner = Scanner(file_path, names)
             parser = Parser(names, devices, network, monitors, scanner)
 
-            # Capture any potential printed terminal outputs in case any
-            # parsing errors occur
-            captured_print = StringIO()
-            captured_print = StringIO()
-            with redirect_stdout(captured_print):
-                parsing_result = parser.parse_network()
-
-            # Store the potential printed terminal outputs
-            output = captured_print.getvalue()
+            # Parse the network
+            parsing_result = parser.parse_network()
 
             # If parsing was successful (i.e., no errors in LDF file)
             if parsing_result:
@@ -826,6 +929,7 @@ class RunSimulationPanel(wx.Panel):
                 new_Gui.Show()
                 self.parent.Close()
             else:  # display the informative error message
+                output = "\n".join(parser.parse_errors)
                 error_dlg = ErrorDialog(self, output, size=(600, 400))
 
                 error_dlg.ShowModal()
@@ -833,27 +937,25 @@ class RunSimulationPanel(wx.Panel):
 
     def on_settings_button(self, event):
         """Handle the event when the user clicks the SETTINGS button."""
-        self.settings_dialog = SettingsDialog(self)
+        if self.settings_dialog is None:
+            self.settings_dialog = SettingsDialog(self)
 
         self.settings_dialog.CenterOnScreen()
 
         self.settings_dialog.ShowModal()
 
-        self.settings_dialog.Destroy()
-
     def on_help_button(self, event):
         """Handle the event when the user clicks the HELP button."""
         self.open_help_dialog()
 
     def open_help_dialog(self):
         """Open a help dialog window."""
-        help_dialog = HelpDialog(self)
+        if self.help_dialog is None:
+            self.help_dialog = HelpDialog(self)
 
-        help_dialog.CenterOnScreen()
+        self.help_dialog.CenterOnScreen()
 
-        help_dialog.ShowModal()
-
-        help_dialog.Destroy()
+        self.help_dialog.ShowModal()
 
 
 class ErrorDialog(wx.Dialog):
@@ -905,11 +1007,7 @@ class ErrorDialog(wx.Dialog):
             wx.ID_ANY,
             style=wx.TE_MULTILINE | wx.TE_READONLY | wx.TE_DONTWRAP)
         error_text.SetValue(error_message)
-        font = wx.Font(
-            12,
-            wx.FONTFAMILY_TELETYPE,
-            wx.FONTSTYLE_NORMAL,
-            wx.FONTWEIGHT_NORMAL)
+        font = _font(12, family=wx.FONTFAMILY_TELETYPE)
         error_text.SetFont(font)
 
         # Add the error text to the Dialog box
@@ -972,23 +1070,16 @@ class SettingsDialog(wx.Dialog):
         bottom_panel.SetSizer(bottom_panel_vbox)
 
         # Create and add widgets to the top panel of the Dialog box
-        text = wx.StaticText(
-            top_panel,
-            wx.ID_ANY,
-            _("GUI Settings"),
-            style=wx.ALIGN_CENTER)
-        font = wx.Font(18, wx.FONTFAMILY_SWISS,
-                       wx.FONTSTYLE_NORMAL, wx.FONTWEIGHT_NORMAL)
-        text.SetFont(font)
+        text = _styled_text(
+            top_panel, _("GUI Settings"), _font(18), style=wx.ALIGN_CENTER)
         top_panel_vbox.Add(text, 0, wx.ALIGN_CENTER)
 
         self.selected_language = None
-        available_languages_list = [
-            "English (GB)", "Español (ES)", "Ελληνικά (EL)"]
+        available_languages_list = list(_LANGUAGES)
         select_language_combo_box = wx.ComboBox(top_panel, wx.ID_ANY, _(
             "Select language"), (90, 50), (160, -1), available_languages_list, wx.CB_DROPDOWN)
-        self.Bind(wx.EVT_COMBOBOX, self.on_select_new_langauge,
-                  select_language_combo_box)
+        select_language_combo_box.Bind(
+            wx.EVT_COMBOBOX, self.on_select_new_langauge)
         top_panel_vbox.Add(
             select_language_combo_box,
             0,
@@ -998,9 +1089,7 @@ class SettingsDialog(wx.Dialog):
         confirm_settings_button = wx.Button(
             bottom_panel, wx.ID_ANY, label=_("CONFIRM SETTINGS"))
         confirm_settings_button.Bind(
-            wx.EVT_BUTTON,
-            self.on_confirm_settings_button,
-            confirm_settings_button)
+            wx.EVT_BUTTON, self.on_confirm_settings_button)
         confirm_settings_button.SetToolTip(_("Confirm settings changes"))
         bottom_panel_vbox.Add(confirm_settings_button, 0,
                               flag=wx.CENTER | wx.BOTTOM)
@@ -1021,42 +1110,18 @@ class SettingsDialog(wx.Dialog):
 
     def on_confirm_settings_button(self, event):
         """Handle the event when the user confirms the choice of selected language"""
-        if self.selected_language is not None:  # confirm if a langauage has been selected
-            if self.selected_language == "English (GB)":
-                new_Gui = Gui(self.parent.path,
-                              self.parent.names,
-                              self.parent.devices,
-                              self.parent.network,
-                              self.parent.monitors,
-                              first_init=False,
-                              locale=wx.Locale(wx.LANGUAGE_ENGLISH))
-                new_Gui.Show()
-                self.parent.settings_dialog.Destroy()
-                self.parent.parent.Close()
-
-            elif self.selected_language == "Español (ES)":
-                new_Gui = Gui(self.parent.path,
-                              self.parent.names,
-                              self.parent.devices,
-                              self.parent.network,
-                              self.parent.monitors,
-                              first_init=False,
-                              locale=wx.Locale(wx.LANGUAGE_SPANISH))
-                new_Gui.Show()
-                self.parent.settings_dialog.Destroy()
-                self.parent.parent.Close()
-
-            elif self.selected_language == "Ελληνικά (EL)":
-                new_Gui = Gui(self.parent.path,
-                              self.parent.names,
-                              self.parent.devices,
-                              self.parent.network,
-                              self.parent.monitors,
-                              first_init=False,
-                              locale=wx.Locale(wx.LANGUAGE_GREEK))
-                new_Gui.Show()
-                self.parent.settings_dialog.Destroy()
-                self.parent.parent.Close()
+        language = _LANGUAGES.get(self.selected_language)
+        if language is not None:  # confirm if a langauage has been selected
+            new_Gui = Gui(self.parent.path,
+                          self.parent.names,
+                          self.parent.devices,
+                          self.parent.network,
+                          self.parent.monitors,
+                          first_init=False,
+                          locale=wx.Locale(language))
+            new_Gui.Show()
+            self.parent.settings_dialog.Destroy()
+            self.parent.parent.Close()
 
 
 class HelpDialog(wx.Dialog):
@@ -1096,12 +1161,19 @@ class HelpDialog(wx.Dialog):
 
         vbox = wx.BoxSizer(wx.VERTICAL)
 
-        help_dialog_file_path = Path(__file__).with_name("help_dialog.txt")
-        with open(help_dialog_file_path, "r", encoding="utf8") as help_dialog_file:
-            help_dialog_text_list = help_dialog_file.readlines()
-        translated_help_dialog_text_list = [
-            _(i) for i in help_dialog_text_list]
-        translated_help_dialog_text = "".join(translated_help_dialog_text_list)
+        # Read and translate the help text only the first time it is shown
+        # in the current language
+        locale = wx.GetLocale()
+        language = locale.GetName() if locale is not None else ""
+        translated_help_dialog_text = _HELP_TEXT.get(language)
+        if translated_help_dialog_text is None:
+            help_dialog_file_path = Path(
+                __file__).with_name("help_dialog.txt")
+            with open(help_dialog_file_path, "r", encoding="utf8") as help_dialog_file:
+                help_dialog_text_list = help_dialog_file.readlines()
+            translated_help_dialog_text = "".join(
+                _(i) for i in help_dialog_text_list)
+            _HELP_TEXT[language] = translated_help_dialog_text
 
         help_message = wx.StaticText(
             self, wx.ID_ANY, translated_help_dialog_text)
@@ -1129,6 +1201,11 @@ class SignalTracesPanel(wx.Panel):
 
     Public methods
     --------------
+    canvas(self): Returns the canvas on which signal traces are drawn, creating it on first use.
+
+    on_open_monitor_menu(self, event): Event handler when the user opens either monitor dropdown menu.
+                                       Fills the menu the first time it is opened.
+
     on_select_new_monitor(self, event): Event handler when the user selects an as-of-yet unmonitored signal.
 
     on_select_zap_monitor(self, event): Event handler when the user selects a currently monitored signal.
@@ -1139,7 +1216,16 @@ class SignalTracesPanel(wx.Panel):
 
     on_recentre_button(self, event): Event handler when the user clicks the "RECENTER" button.
 
-    update_canvas(self): Updates the canvas with the newly added/deleted signals to monitor in the logic network.
+    update_canvas(self): Updates the canvas with the newly added/deleted signals to monitor in the logic network,
+                         once the GUI is next idle.
+
+    on_idle(self, event): Event handler for when the GUI is idle. Updates the canvas if it is outdated.
+
+    on_first_paint(self, event): Event handler for the first paint of the signal traces area. Schedules creating the canvas.
+
+    show_canvas(self): Creates the canvas if it has not been created yet.
+
+    reset_monitors(self): Resets the monitor dropdown menus and the canvas to show the monitors of the current network.
     """
 
     def __init__(self, parent, names, devices, network, monitors):
@@ -1185,34 +1271,29 @@ class SignalTracesPanel(wx.Panel):
 
         # Create and add "Add new monitor" text to centre of add new monitor
         # panel
-        str = _("ADD NEW MONITOR")
-        text = wx.StaticText(self.add_new_monitor_panel_centre, wx.ID_ANY, str)
-        font = wx.Font(
-            15,
-            wx.FONTFAMILY_SWISS,
-            wx.FONTSTYLE_NORMAL,
-            wx.FONTWEIGHT_NORMAL,
-            faceName="Arial")
-        text.SetFont(font)
+        text = _styled_text(self.add_new_monitor_panel_centre,
+                            _("ADD NEW MONITOR"), _font(15, face="Arial"))
         add_new_monitor_panel_centre_fgs.Add(text, 0, flag=wx.ALIGN_CENTER)
 
-        # Get the ids and user-defined names of all monitored and (as-of-yet)
+        # Get the user-defined names of all monitored and (as-of-yet)
         # unmonitored devices
-        self.monitored_devices_names = self.monitors.get_signal_names()[0]
-        self.monitored_devices_ids = self.names.lookup(
-            self.monitored_devices_names)
-        self.unmonitored_devices_names = self.monitors.get_signal_names()[1]
-        self.unmonitored_devices_ids = self.names.lookup(
-            self.unmonitored_devices_names)
+        self.monitored_devices_names, self.unmonitored_devices_names = \
+            self.monitors.get_signal_names()
+
+        # Keep the items of each dropdown menu in a set too, for fast
+        # membership checks
+        self.select_monitor_items = set(self.unmonitored_devices_names)
+        self.zap_monitor_items = set(self.monitored_devices_names)
 
         # Create and add the dropdown menu for the as-of-yet unmonitored
         # devices, ready to be monitored
         self.selected_signal_to_monitor = None
-        self.monitor_output_list = self.unmonitored_devices_names
         self.select_monitor_combo_box = wx.ComboBox(self.add_new_monitor_panel_centre, wx.ID_ANY, _(
-            "Select output"), (90, 50), (160, -1), self.monitor_output_list, wx.CB_DROPDOWN)
-        self.Bind(wx.EVT_COMBOBOX, self.on_select_new_monitor,
-                  self.select_monitor_combo_box)
+            "Select output"), (90, 50), (160, -1), [], wx.CB_DROPDOWN)
+        self.select_monitor_combo_box.Bind(
+            wx.EVT_COMBOBOX, self.on_select_new_monitor)
+        self.select_monitor_combo_box.Bind(
+            wx.EVT_COMBOBOX_DROPDOWN, self.on_open_monitor_menu)
         add_new_monitor_panel_centre_fgs.Add(
             self.select_monitor_combo_box,
             0,
@@ -1223,32 +1304,34 @@ class SignalTracesPanel(wx.Panel):
         # monitored device's signal trace on SignalTraces panel
         self.add_new_monitor_button = wx.Button(
             self.add_new_monitor_panel_centre, wx.ID_ANY, label="+")
-        self.Bind(wx.EVT_BUTTON, self.on_add_new_monitor_button,
-                  self.add_new_monitor_button)
+        self.add_new_monitor_button.Bind(
+            wx.EVT_BUTTON, self.on_add_new_monitor_button)
         self.add_new_monitor_button.SetToolTip(_("Add a monitor"))
         add_new_monitor_panel_centre_fgs.Add(
             self.add_new_monitor_button, 1, flag=wx.CENTER | wx.EXPAND)
 
         # Create and add "Zap a monitor" text to add new monitor panel
-        str = _("DELETE MONITOR")
-        text = wx.StaticText(self.add_new_monitor_panel_centre, wx.ID_ANY, str)
-        font = wx.Font(15, wx.FONTFAMILY_SWISS,
-                       wx.FONTSTYLE_NORMAL, wx.FONTWEIGHT_NORMAL)
-        text.SetFont(font)
+        text = _styled_text(self.add_new_monitor_panel_centre,
+                            _("DELETE MONITOR"), _font(15))
         add_new_monitor_panel_centre_fgs.Add(text, 0, flag=wx.ALIGN_LEFT)
 
         # Create and add the dropdown menu for the currently monitored devices,
         # ready to be zapped
         self.selected_signal_to_zap = None
-        self.monitor_output_list = self.monitored_devices_names
         self.zap_monitor_combo_box = wx.ComboBox(self.add_new_monitor_panel_centre, wx.ID_ANY, _("Select output"), (90, 50),
-                                                 (160, -1), self.monitor_output_list,
+                                                 (160, -1), [],
                                                  wx.CB_DROPDOWN
                                                  # | wx.TE_PROCESS_ENTER
                                                  # | wx.CB_SORT
                                                  )
-        self.Bind(wx.EVT_COMBOBOX, self.on_select_zap_monitor,
-                  self.zap_monitor_combo_box)
+        self.zap_monitor_combo_box.Bind(
+            wx.EVT_COMBOBOX, self.on_select_zap_monitor)
+        self.zap_monitor_combo_box.Bind(
+            wx.EVT_COMBOBOX_DROPDOWN, self.on_open_monitor_menu)
+
+        # Both dropdown menus are only filled the first time they are opened
+        self.select_monitor_menu_filled = False
+        self.zap_monitor_menu_filled = False
         add_new_monitor_panel_centre_fgs.Add(
             self.zap_monitor_combo_box,
             0,
@@ -1259,8 +1342,8 @@ class SignalTracesPanel(wx.Panel):
         # currently monitored device's signal trace on SignalTraces panel
         self.zap_existing_monitor_button = wx.Button(
             self.add_new_monitor_panel_centre, wx.ID_ANY, label="-")
-        self.Bind(wx.EVT_BUTTON, self.on_zap_existing_monitor,
-                  self.zap_existing_monitor_button)
+        self.zap_existing_monitor_button.Bind(
+            wx.EVT_BUTTON, self.on_zap_existing_monitor)
         self.zap_existing_monitor_button.SetToolTip(
             _("Delete an existing monitor"))
         add_new_monitor_panel_centre_fgs.Add(
@@ -1284,14 +1367,8 @@ class SignalTracesPanel(wx.Panel):
             wx.ID_ANY,
             _("RECENTER"),
             name="recentre button")
-        self.Bind(wx.EVT_BUTTON, self.on_recentre_button, self.recentre_button)
-        self.recentre_button.SetFont(
-            wx.Font(
-                10,
-                wx.FONTFAMILY_SWISS,
-                wx.FONTSTYLE_NORMAL,
-                wx.FONTWEIGHT_BOLD,
-                False))
+        self.recentre_button.Bind(wx.EVT_BUTTON, self.on_recentre_button)
+        self.recentre_button.SetFont(_font(10, wx.FONTWEIGHT_BOLD))
         self.recentre_button.SetBezelWidth(5)
         self.recentre_button.SetMinSize(wx.DefaultSize)
         self.recentre_button.SetBackgroundColour(wx.Colour(85, 26, 139))
@@ -1300,9 +1377,17 @@ class SignalTracesPanel(wx.Panel):
         add_new_monitor_panel_right_vbox.Add(
             self.recentre_button, 1, flag=wx.EXPAND, border=5)
 
-        # Canvas for drawing signals
-        self.canvas = MyGLCanvas(self.signal_traces_panel, devices, monitors)
-        signal_traces_panel_vbox.Add(self.canvas, 1, wx.EXPAND)
+        # Canvas for drawing signals, created (along with its OpenGL
+        # context) only when it is first needed, or once the signal traces
+        # area is first painted so the monitored signals show from the start
+        self.signal_traces_panel_vbox = signal_traces_panel_vbox
+        self._canvas = None
+        self.signal_traces_panel.Bind(wx.EVT_PAINT, self.on_first_paint)
+
+        # Bring the canvas up to date once the pending events have been
+        # handled, so rapid monitor changes only update it once
+        self.canvas_outdated = False
+        self.Bind(wx.EVT_IDLE, self.on_idle)
 
         vbox.Add(self.signal_traces_panel, 4, flag=wx.EXPAND)
         vbox.Add(self.add_new_monitor_panel, 1, flag=wx.EXPAND)
@@ -1310,6 +1395,49 @@ class SignalTracesPanel(wx.Panel):
         # Set sizer of SignalTracesPanel
         self.SetSizer(vbox)
 
+    @property
+    def canvas(self):
+        """Return the canvas for drawing signals, creating it on first use."""
+        if self._canvas is None:
+            self._canvas = MyGLCanvas(
+                self.signal_traces_panel, self.devices, self.monitors)
+            self.signal_traces_panel_vbox.Add(self._canvas, 1, wx.EXPAND)
+            self.signal_traces_panel.Layout()
+        return self._canvas
+
+    def on_first_paint(self, event):
+        """Handle the first paint event of the signal traces area.
+
+        Create the canvas after the paint, once the frame is on screen.
+        """
+        event.Skip()
+        self.signal_traces_panel.Unbind(
+            wx.EVT_PAINT, handler=self.on_first_paint)
+        wx.CallAfter(self.show_canvas)
+
+    def show_canvas(self):
+        """Create the canvas if it has not been created yet."""
+        # Nothing to show if the panel was destroyed in the meantime
+        if self:
+            self.canvas
+
+    def on_open_monitor_menu(self, event):
+        """Handle the event when the user opens either monitor dropdown menu.
+
+        Fill the menu with its signal names if it is opened for the first time.
+        """
+        combo_box = event.GetEventObject()
+        if combo_box is self.select_monitor_combo_box:
+            if not self.select_monitor_menu_filled:
+                self.select_monitor_menu_filled = True
+                combo_box.Set(self.monitors.get_signal_names()[1])
+                combo_box.SetValue(_("Select output"))
+        elif not self.zap_monitor_menu_filled:
+            self.zap_monitor_menu_filled = True
+            combo_box.Set(self.monitors.get_signal_names()[0])
+            combo_box.SetValue(_("Select output"))
+        event.Skip()
+
     def on_select_new_monitor(self, event):
         """Handle the event when the user selects an as-of-yet unmonitored signal to monitor."""
         select_monitor_combo_box = event.GetEventObject()
@@ -1334,20 +1462,33 @@ class SignalTracesPanel(wx.Panel):
 
             self.update_canvas()
 
+            # Move the signal between the dropdown menus in a single repaint
+            self.select_monitor_combo_box.Freeze()
+            self.zap_monitor_combo_box.Freeze()
+
             selected_signal_to_monitor_selection_index = self.select_monitor_combo_box.GetSelection()
             if selected_signal_to_monitor_selection_index != wx.NOT_FOUND:
+                self.select_monitor_items.discard(
+                    self.select_monitor_combo_box.GetString(
+                        selected_signal_to_monitor_selection_index))
                 # remove the selected signal to monitor from add menu
                 self.select_monitor_combo_box.Delete(
                     selected_signal_to_monitor_selection_index)
 
             # confirm if selected signal not already in zap menu
-            if self.selected_signal_to_monitor not in self.zap_monitor_combo_box.GetItems():
-                # add selected signal to monitor to zap menu
-                self.zap_monitor_combo_box.Append(
-                    self.selected_signal_to_monitor)
+            if self.selected_signal_to_monitor not in self.zap_monitor_items:
+                # add selected signal to monitor to zap menu (an unfilled
+                # menu picks it up when it is first opened)
+                if self.zap_monitor_menu_filled:
+                    self.zap_monitor_combo_box.Append(
+                        self.selected_signal_to_monitor)
+                self.zap_monitor_items.add(self.selected_signal_to_monitor)
             else:
                 pass
 
+            self.zap_monitor_combo_box.Thaw()
+            self.select_monitor_combo_box.Thaw()
+
     def on_zap_existing_monitor(self, event):
         """Handle the event when the user clicks the zap existing monitor button."""
         zap_existing_monitor_button_pressed = event.GetEventObject()
@@ -1362,35 +1503,82 @@ class SignalTracesPanel(wx.Panel):
 
             self.update_canvas()
 
+            # Move the signal between the dropdown menus in a single repaint
+            self.zap_monitor_combo_box.Freeze()
+            self.select_monitor_combo_box.Freeze()
+
             selected_signal_to_zap_selection_index = self.zap_monitor_combo_box.GetSelection()
             if selected_signal_to_zap_selection_index != wx.NOT_FOUND:
+                self.zap_monitor_items.discard(
+                    self.zap_monitor_combo_box.GetString(
+                        selected_signal_to_zap_selection_index))
                 # remove the currently monitored signal from zap menu
                 self.zap_monitor_combo_box.Delete(
                     selected_signal_to_zap_selection_index)
 
             # confirm if selected signal not already in add menu
-            if self.selected_signal_to_zap not in self.select_monitor_combo_box.GetItems():
-                # add currently monitored signal to add menu
-                self.select_monitor_combo_box.Append(
-                    self.selected_signal_to_zap)
+            if self.selected_signal_to_zap not in self.select_monitor_items:
+                # add currently monitored signal to add menu (an unfilled
+                # menu picks it up when it is first opened)
+                if self.select_monitor_menu_filled:
+                    self.select_monitor_combo_box.Append(
+                        self.selected_signal_to_zap)
+                self.select_monitor_items.add(self.selected_signal_to_zap)
             else:
                 pass
 
+            self.select_monitor_combo_box.Thaw()
+            self.zap_monitor_combo_box.Thaw()
+
     def on_recentre_button(self, event):
         """Handle the event when the user clicks the RECENTER button."""
         self.canvas.recenter_canvas()
 
     def update_canvas(self):
-        """Update the canvas with the newly added/deleted signals to monitor in the logic network."""
-        self.canvas.update_arguments(self.devices, self.monitors)
+        """Update the canvas with the newly added/deleted signals to monitor in the logic network.
+
+        The update itself is deferred to on_idle.
+        """
+        self.canvas_outdated = True
+
+    def on_idle(self, event):
+        """Handle the idle event by updating the canvas if it is outdated."""
+        if self.canvas_outdated:
+            self.canvas_outdated = False
+            self.canvas.update_arguments(self.devices, self.monitors)
+        event.Skip()
+
+    def reset_monitors(self):
+        """Reset the monitor dropdown menus and the canvas to show the monitors of the current network."""
+        self.monitored_devices_names, self.unmonitored_devices_names = \
+            self.monitors.get_signal_names()
+        self.select_monitor_items = set(self.unmonitored_devices_names)
+        self.zap_monitor_items = set(self.monitored_devices_names)
+
+        # Empty both dropdown menus, to be filled again when next opened
+        self.selected_signal_to_monitor = None
+        self.select_monitor_combo_box.Clear()
+        self.select_monitor_combo_box.SetValue(_("Select output"))
+        self.select_monitor_menu_filled = False
+
+        self.selected_signal_to_zap = None
+        self.zap_monitor_combo_box.Clear()
+        self.zap_monitor_combo_box.SetValue(_("Select output"))
+        self.zap_monitor_menu_filled = False
+
+        self.canvas_outdated = False
+        if self._canvas is not None:
+            self._canvas.current_time = 0
+            self._canvas.update_arguments(self.devices, self.monitors)
+            self._canvas.recenter_canvas()
 
 
 class SwitchesPanel(wx.Panel):
     """Configure the switches panel and all the widgets.
 
     This class provides the switches panel for the Gui which displays the list of switches as provided in the supplied
-    logic description file. It enables the user to use toggle buttons to change the state of the switches which are shown
-    in the switch state indicators beside the respective switch toggle button.
+    logic description file. It enables the user to click the switch sliders to change the state of the switches which are shown
+    in the switch state indicators beside the respective switch slider. All the switches are drawn on a single panel.
 
     Parameters
     ----------
@@ -1403,7 +1591,13 @@ class SwitchesPanel(wx.Panel):
 
     Public methods
     --------------
-    on_switch_slider_button(self, event): Event handler for when the user clicks the slider for a switch.
+    on_paint_switches(self, event): Event handler for when the switch canvas is painted.
+
+    on_switch_canvas_click(self, event): Event handler for when the user clicks the slider or indicator for a switch.
+
+    build_switch_entries(self): Stores the switches of the current network and sizes the switch canvas to fit them.
+
+    reset_switches(self): Shows the switches of the current network.
     """
 
     def __init__(
@@ -1429,11 +1623,7 @@ class SwitchesPanel(wx.Panel):
         hbox = wx.BoxSizer(wx.HORIZONTAL)
 
         # Create and add the title to SwitchesPanel
-        str = _("INPUTS")
-        text = wx.StaticText(self, wx.ID_ANY, str, style=wx.ALIGN_CENTER)
-        font = wx.Font(18, wx.FONTFAMILY_SWISS,
-                       wx.FONTSTYLE_NORMAL, wx.FONTWEIGHT_NORMAL)
-        text.SetFont(font)
+        text = _styled_text(self, _("INPUTS"), _font(18), style=wx.ALIGN_CENTER)
         vbox.Add(text, 0, wx.EXPAND)
 
         # Create and add a separating line between switches title and switch
@@ -1450,306 +1640,179 @@ class SwitchesPanel(wx.Panel):
         self.switch_buttons_scrolled_panel = wxscrolledpanel.ScrolledPanel(
             self.switches_panel, name="switch buttons scrolled panel")
 
-        # Get the ids and user-defined names of all SWITCH-type devices
-        switch_ids = devices.find_devices(device_kind=devices.SWITCH)
-        switch_names = [names.get_name_string(i) for i in switch_ids]
-
-        # Configure sizer of ScrolledPanel
-        self.num_of_switches = len(switch_names)
-        self.fgs = wx.FlexGridSizer(
-            cols=3, rows=self.num_of_switches, vgap=4, hgap=4)
-
-        # Get the width of the ON text (language dependent)
-        on_dc = wx.ScreenDC()
-        on_dc.SetFont(font)
-        on_text_width, on_text_height = on_dc.GetTextExtent(_("ON"))
-
-        # Get the width of the OFF text (language dependent)
-        off_dc = wx.ScreenDC()
-        off_dc.SetFont(font)
-        off_text_width, off_text_height = off_dc.GetTextExtent(_("OFF"))
-
-        # Select the text width as the greater one between that of ON or OFF
-        # (langauge dependent)
-        self.text_width = off_text_width if off_text_width > on_text_width else on_text_width
-
-        # Instantiate a default dictionary of lists for the switches dictionary
-        self.switch_dict = defaultdict(list)
-        for switch_name in switch_names:
-            # Get the id and initial state of a switch
-            switch_id = self.names.query(switch_name)
-            initial_switch_state = devices.get_device(switch_id).switch_state
-
-            # Create the text for a switch based on its name
-            switch_name_text = wx.StaticText(
-                parent=self.switch_buttons_scrolled_panel,
-                id=wx.ID_ANY,
-                label=f"{switch_name}",
-                style=wx.ALIGN_LEFT)
-            font = wx.Font(
-                15,
-                wx.FONTFAMILY_SWISS,
-                wx.FONTSTYLE_NORMAL,
-                wx.FONTWEIGHT_NORMAL,
-                False)
-            switch_name_text.SetFont(font)
-
-            # Create the panel for the switch slider
-            switch_slider_panel = wx.Panel(
-                parent=self.switch_buttons_scrolled_panel,
-                id=wx.ID_ANY,
-                style=wx.BORDER_SUNKEN,
-                size=(
-                    90,
-                    30))
-            switch_slider_panel_sizer = wx.BoxSizer(wx.VERTICAL)
-            switch_slider_panel.SetSizer(switch_slider_panel_sizer)
-
-            # Create the button for the switch slider and assign its pointer as
-            # the same as the id of its respective panel
-            switch_slider_button = wxbuttons.GenButton(
-                parent=switch_slider_panel, id=wx.ID_ANY, label="", name="switch slider")
-            switch_slider_id = switch_slider_panel.GetId()
-
-            # Bind the switch slider sliding event to the switch slider button
-            self.Bind(
-                wx.EVT_BUTTON,
-                self.on_switch_slider_button,
-                switch_slider_button)
-            switch_slider_button.SetBezelWidth(5)
-            switch_slider_button.SetMinSize((45, 30))
-            switch_slider_button.SetBackgroundColour(wx.Colour(112, 112, 112))
-
-            # Assign the initial position of the switch slider depending on
-            # initial switch state
-            if initial_switch_state == 1:
-                switch_slider_panel_sizer.Add(
-                    switch_slider_button, 0, flag=wx.ALIGN_RIGHT, border=5)
-            elif initial_switch_state == 0:
-                switch_slider_panel_sizer.Add(
-                    switch_slider_button, 0, flag=wx.ALIGN_LEFT, border=5)
-
-            # Assign the switch indicator to either ON or OFF depending on
-            # initial switch state
-            if initial_switch_state == 1:
-                switch_state_indicator_panel = wx.Panel(
-                    parent=self.switch_buttons_scrolled_panel,
-                    id=wx.ID_ANY,
-                    style=wx.BORDER_RAISED,
-                    size=(
-                        50,
-                        30))
-                switch_state_indicator_panel.SetBackgroundColour(
-                    wx.Colour(4, 84, 14))
-                switch_state_indicator_panel_sizer = wx.BoxSizer(wx.VERTICAL)
-                switch_state_indicator_panel.SetSizer(
-                    switch_state_indicator_panel_sizer)
-
-                text = wx.StaticText(
-                    switch_state_indicator_panel,
-                    wx.ID_ANY,
-                    _("ON"),
-                    style=wx.ALIGN_LEFT)
-                text.SetForegroundColour(wx.WHITE)
-                switch_state_indicator_panel.SetMinSize((self.text_width, 30))
-                switch_state_indicator_panel.Refresh()
-                switch_state_indicator_panel.Update()
-
-                switch_state_indicator_panel_sizer.Add(text, 0, flag=wx.CENTER)
-            elif initial_switch_state == 0:
-                switch_state_indicator_panel = wx.Panel(
-                    parent=self.switch_buttons_scrolled_panel,
-                    id=wx.ID_ANY,
-                    style=wx.BORDER_RAISED,
-                    size=(
-                        50,
-                        30))
-                switch_state_indicator_panel.SetBackgroundColour(
-                    wx.Colour(139, 26, 26))
-                switch_state_indicator_panel_sizer = wx.BoxSizer(wx.VERTICAL)
-                switch_state_indicator_panel.SetSizer(
-                    switch_state_indicator_panel_sizer)
-
-                text = wx.StaticText(
-                    switch_state_indicator_panel,
-                    wx.ID_ANY,
-                    _("OFF"),
-                    style=wx.ALIGN_LEFT)
-                text.SetForegroundColour(wx.WHITE)
-                switch_state_indicator_panel.SetMinSize((self.text_width, 30))
-                switch_state_indicator_panel.Refresh()
-                switch_state_indicator_panel.Update()
-
-                switch_state_indicator_panel_sizer.Add(text, 0, flag=wx.CENTER)
-
-            # Add all relevant switch information to the switches dictionary
-            self.switch_dict[switch_slider_id].extend(
-                [
-                    switch_id,
-                    switch_name,
-                    initial_switch_state,
-                    switch_slider_panel,
-                    switch_slider_panel_sizer,
-                    switch_state_indicator_panel,
-                    switch_state_indicator_panel_sizer])
-
-            # Add switch slider/toggle buttons to ScrolledPanel
-            self.fgs.Add(switch_name_text, 0, flag=wx.ALL, border=12)
-            self.fgs.Add(switch_slider_panel, 2, flag=wx.ALL, border=10)
-            self.fgs.Add(
-                switch_state_indicator_panel,
-                1,
-                flag=wx.ALL,
-                border=10)
+        # Get the text width as the greater one between that of ON or OFF
+        # (language dependent), measuring it only once per language
+        state_labels = (_("ON"), _("OFF"))
+        self.text_width = _STATE_LABEL_WIDTHS.get(state_labels)
+        if self.text_width is None:
+            dc = wx.ScreenDC()
+            dc.SetFont(_font(18))
+            self.text_width = max(
+                dc.GetTextExtent(label)[0] for label in state_labels)
+            _STATE_LABEL_WIDTHS[state_labels] = self.text_width
+
+        # Suppress repaints of the ScrolledPanel until it is fully set up
+        self.switch_buttons_scrolled_panel.Freeze()
+
+        # Create a single panel on which every switch is drawn, rather than
+        # creating a set of widgets for each switch
+        self.switch_canvas = wx.Panel(
+            self.switch_buttons_scrolled_panel, name="switch canvas")
+        self.switch_canvas.SetBackgroundStyle(wx.BG_STYLE_PAINT)
+        self.switch_canvas.SetFont(_font(15))
+        self.switch_canvas.Bind(wx.EVT_PAINT, self.on_paint_switches)
+        self.switch_canvas.Bind(wx.EVT_LEFT_DOWN, self.on_switch_canvas_click)
+
+        # Store the switches of the network and size the canvas to fit them
+        self.build_switch_entries()
+        switch_canvas_sizer = wx.BoxSizer(wx.VERTICAL)
+        switch_canvas_sizer.Add(self.switch_canvas, 0)
 
         # Set sizer of ScrolledPanel
-        self.switch_buttons_scrolled_panel.SetSizer(self.fgs)
+        self.switch_buttons_scrolled_panel.SetSizer(switch_canvas_sizer)
         self.switch_buttons_scrolled_panel.SetAutoLayout(1)
         self.switch_buttons_scrolled_panel.SetupScrolling(
             scroll_x=True,
             scroll_y=True,
             rate_x=20,
             rate_y=20,
-            scrollToTop=True,
-            scrollIntoView=True)
+            scrollToTop=False,
+            scrollIntoView=False)
+        self.switch_buttons_scrolled_panel.Thaw()
 
         # Add the ScrolledPanel widget to SwitchesPanel
         hbox.Add(self.switch_buttons_scrolled_panel, 3, wx.EXPAND)
 
-        self.add_switch_panel = wx.Panel(self)
-        add_switch_panel_hbox = wx.BoxSizer(wx.HORIZONTAL)
-        self.add_switch_panel.SetSizer(add_switch_panel_hbox)
-
-        self.add_switch_panel_centre = wx.Panel(self.add_switch_panel)
-        add_switch_panel_hbox.Add(self.add_switch_panel_centre, 2, wx.EXPAND)
-
-        vbox.Add(self.add_switch_panel, 1, wx.EXPAND)
+        # Keep the space below the switches that the layout expects
+        vbox.AddStretchSpacer(1)
 
         # Set sizer of SwitchesPanel
         self.SetSizer(vbox)
 
-    def on_switch_slider_button(self, event):
-        """Handle the event when the user clicks the slider for a switch."""
-        # Collect all the information for a switch as supplied by the switches
-        # dictionary
-        selected_switch_panel_id = event.GetEventObject().GetParent().GetId()
-        selected_switch_id = self.switch_dict[selected_switch_panel_id][0]
-        selected_switch_name = self.switch_dict[selected_switch_panel_id][1]
-        selected_switch_state = self.switch_dict[selected_switch_panel_id][2]
-        selected_switch_panel = self.switch_dict[selected_switch_panel_id][3]
-        selected_switch_panel_sizer = self.switch_dict[selected_switch_panel_id][4]
-        selected_switch_state_indicator_panel = self.switch_dict[selected_switch_panel_id][5]
-        selected_switch_state_indicator_panel_sizer = self.switch_dict[
-            selected_switch_panel_id][6]
-
-        # Destroy the window holding the current switch slider
-        # in preparation for re-adding switch slider to the other side,
-        # part of the illusion of the switch slider "sliding" to the side
-        selected_switch_panel_window = selected_switch_panel_sizer.GetItem(
-            0).GetWindow()
-        selected_switch_panel_window.Destroy()
-
-        # Destroy the window holding the current switch state indicator
-        # in preparation for re-adding the switch state indicator with the new
-        # state of the switch
-        selected_switch_state_indicator_panel_window = selected_switch_state_indicator_panel_sizer.GetItem(
-            0).GetWindow()
-        selected_switch_state_indicator_panel_window.Destroy()
-
-        if selected_switch_state == 0:  # switch is currently OFF
-            # Change the state of the switch from 0FF --> ON
-            selected_switch_state = 1  # switch is now ON
-            self.devices.set_switch(selected_switch_id, selected_switch_state)
-            self.switch_dict[selected_switch_panel_id][2] = selected_switch_state
-
-            # Add switch slider button for the ON state
-            # giving the illusion of the switch slider moving from left to
-            # right
-            switch_slider_button = wxbuttons.GenButton(
-                parent=selected_switch_panel, id=wx.ID_ANY, label="")
-
-            self.Bind(
-                wx.EVT_BUTTON,
-                self.on_switch_slider_button,
-                switch_slider_button)
-            switch_slider_button.SetBezelWidth(5)
-            switch_slider_button.SetMinSize((45, 30))
-            switch_slider_button.SetBackgroundColour(wx.Colour(112, 112, 112))
-
-            # Update the switch panel with the new switch slider position
-            selected_switch_panel_sizer.Add(
-                switch_slider_button, 0, flag=wx.ALIGN_RIGHT, border=5)
-            selected_switch_panel.GetSizer().Layout()
-            selected_switch_panel.Refresh()
-            selected_switch_panel.Update()
-
-            # Add the switch state indicator for the ON state
-            selected_switch_state_indicator_panel.SetBackgroundColour(
-                wx.Colour(4, 84, 14))
-            text = wx.StaticText(
-                selected_switch_state_indicator_panel,
-                wx.ID_ANY,
-                _("ON"),
-                style=wx.ALIGN_LEFT)
-            text.SetForegroundColour(wx.WHITE)
-            selected_switch_state_indicator_panel.SetMinSize(
-                (self.text_width, 30))
-
-            # Update the switch state indicator with the ON state
-            selected_switch_state_indicator_panel_sizer.Add(
-                text, 0, flag=wx.CENTER)
-            selected_switch_state_indicator_panel.GetSizer().Layout()
-            selected_switch_state_indicator_panel.Refresh()
-            selected_switch_state_indicator_panel.Update()
-
-        elif selected_switch_state == 1:  # switch is currently ON
-            # Change the state of the switch from 0N --> OFF
-            selected_switch_state = 0  # switch is now OFF
-            self.devices.set_switch(selected_switch_id, selected_switch_state)
-            self.switch_dict[selected_switch_panel_id][2] = selected_switch_state
-
-            # Add switch slider button for the OFF state
-            # giving the illusion of the switch slider moving from right to
-            # left
-            switch_slider_button = wxbuttons.GenButton(
-                parent=selected_switch_panel, id=wx.ID_ANY, label="")
-
-            self.Bind(
-                wx.EVT_BUTTON,
-                self.on_switch_slider_button,
-                switch_slider_button)
-            switch_slider_button.SetBezelWidth(5)
-            switch_slider_button.SetMinSize((45, 30))
-            switch_slider_button.SetBackgroundColour(wx.Colour(112, 112, 112))
-
-            # Update the switch panel with the new switch slider position
-            selected_switch_panel_sizer.Add(
-                switch_slider_button, 0, flag=wx.ALIGN_LEFT, border=5)
-            selected_switch_panel.GetSizer().Layout()
-            selected_switch_panel.Refresh()
-            selected_switch_panel.Update()
-
-            # Add the switch state indicator for the OFF state
-            selected_switch_state_indicator_panel.SetBackgroundColour(
-                wx.Colour(139, 26, 26))
-            text = wx.StaticText(
-                selected_switch_state_indicator_panel,
-                wx.ID_ANY,
-                _("OFF"),
-                style=wx.ALIGN_LEFT)
-            font = wx.Font(
-                15,
-                wx.FONTFAMILY_SWISS,
-                wx.FONTSTYLE_NORMAL,
-                wx.FONTWEIGHT_NORMAL,
-                False)
-            text.SetForegroundColour(wx.WHITE)
-            selected_switch_state_indicator_panel.SetMinSize(
-                (self.text_width, 30))
-
-            # Update the switch state indicator with the OFF state
-            selected_switch_state_indicator_panel_sizer.Add(
-                text, 0, flag=wx.CENTER)
-            selected_switch_state_indicator_panel.GetSizer().Layout()
-            selected_switch_state_indicator_panel.Refresh()
-            selected_switch_state_indicator_panel.Update()
+        # Paint the panel and its children through a single back buffer
+        self.SetDoubleBuffered(True)
+
+    def on_paint_switches(self, event):
+        """Handle the paint event of the switch canvas.
+
+        Each switch is drawn as its name, a slider (knob on the left when OFF,
+        on the right when ON) and a coloured ON/OFF state indicator.
+        """
+        dc = wx.AutoBufferedPaintDC(self.switch_canvas)
+        dc.SetBackground(wx.Brush(self.switch_canvas.GetBackgroundColour()))
+        dc.Clear()
+        dc.SetFont(self.switch_canvas.GetFont())
+
+        # Only draw the switches in the area that needs repainting, such as
+        # the rows scrolled into view or a single toggled switch
+        update_region = self.switch_canvas.GetUpdateRegion()
+        canvas_width = self.switch_canvas.GetClientSize().width
+
+        for entry in self.switch_dict.values():
+            rect = entry.rect
+            row_rect = wx.Rect(0, rect.y, canvas_width, rect.height)
+            if update_region.Contains(row_rect) == wx.OutRegion:
+                continue
+            label, knob_offset, indicator_colour = _SWITCH_STATES[entry.state]
+
+            # Draw the name of the switch
+            name = entry.name
+            name_height = dc.GetTextExtent(name)[1]
+            dc.SetTextForeground(self.switch_canvas.GetForegroundColour())
+            dc.DrawText(name, 12, rect.y + (rect.height - name_height) // 2)
+
+            # Draw the slider track and the slider knob on the side given by
+            # the state of the switch
+            dc.SetPen(wx.ThePenList.FindOrCreatePen(_COL_GREY))
+            dc.SetBrush(wx.WHITE_BRUSH)
+            dc.DrawRectangle(rect.x, rect.y, 90, rect.height)
+            dc.SetBrush(wx.TheBrushList.FindOrCreateBrush(_COL_GREY))
+            dc.DrawRoundedRectangle(
+                rect.x + knob_offset, rect.y, 45, rect.height, 4)
+
+            # Draw the switch state indicator
+            indicator_rect = wx.Rect(
+                rect.x + 110, rect.y, rect.width - 110, rect.height)
+            dc.SetPen(wx.ThePenList.FindOrCreatePen(indicator_colour))
+            dc.SetBrush(wx.TheBrushList.FindOrCreateBrush(indicator_colour))
+            dc.DrawRoundedRectangle(indicator_rect, 4)
+            dc.SetTextForeground(wx.WHITE)
+            dc.DrawLabel(_(label), indicator_rect, wx.ALIGN_CENTER)
+
+    def on_switch_canvas_click(self, event):
+        """Handle the event when the user clicks on the switch canvas.
+
+        Clicking on the slider or state indicator of a switch toggles it.
+        """
+        position = event.GetPosition()
+        for entry in self.switch_dict.values():
+            if entry.rect.Contains(position):
+                entry.state ^= 1
+                self.devices.set_switch(entry.device_id, entry.state)
+                self.switch_canvas.RefreshRect(
+                    entry.rect, eraseBackground=False)
+                break
+        event.Skip()
+
+    def build_switch_entries(self):
+        """Store the switches of the current network and size the switch canvas to fit them."""
+        # Get the ids and user-defined names of all SWITCH-type devices
+        switch_ids = self.devices.find_devices(device_kind=self.devices.SWITCH)
+        switch_names = [self.names.get_name_string(i) for i in switch_ids]
+        self.num_of_switches = len(switch_names)
+
+        # Position the switch sliders to the right of the longest switch name
+        switch_names_width = max(
+            [self.switch_canvas.GetTextExtent(i)[0] for i in switch_names],
+            default=0)
+        slider_x = switch_names_width + 34
+        row_height = 54
+
+        # Store the name, state and clickable area (slider and state
+        # indicator) of each switch in the switches dictionary
+        self.switch_dict = {}
+        for row, (switch_id, switch_name) in enumerate(
+                zip(switch_ids, switch_names)):
+            self.switch_dict[switch_id] = SwitchEntry(
+                switch_id,
+                switch_name,
+                self.devices.get_device(switch_id).switch_state,
+                wx.Rect(
+                    slider_x, row * row_height + 12, 120 + self.text_width, 30))
+
+        # Size the switch canvas to fit all the switches so that the
+        # ScrolledPanel can scroll over it
+        self.switch_canvas.SetMinSize(
+            (slider_x + 140 + self.text_width,
+             self.num_of_switches * row_height + 12))
+
+    def reset_switches(self):
+        """Show the switches of the current network.
+
+        The switches are rebuilt, as the LDF may have gained, lost or renamed
+        switches since it was last parsed.
+        """
+        self.build_switch_entries()
+        self.switch_buttons_scrolled_panel.Layout()
+        self.switch_buttons_scrolled_panel.FitInside()
+        self.switch_canvas.Refresh(eraseBackground=False)
+
+
+@dataclass
+class SwitchEntry:
+    """Store the drawing and state information of a single switch.
+
+    Parameters
+    ----------
+    device_id: id of the switch device.
+    name: user-defined name of the switch.
+    state: current state of the switch (0 for OFF, 1 for ON).
+    rect: clickable area of the switch slider and state indicator.
+    """
+
+    __slots__ = ("device_id", "name", "state", "rect")
+
+    device_id: int
+    name: str
+    state: int
+    rect: wx.Rect
@@ -7,9 +7,26 @@ Classes:
 MyGLCanvas - handles all canvas drawing operations.
 """
 
+import OpenGL
 import wx
 import wx.glcanvas as wxcanvas
-from OpenGL import GL, GLUT
+
+# Stop PyOpenGL calling glGetError after every OpenGL call. This has to be
+# set before OpenGL.GL is first imported
+OpenGL.ERROR_CHECKING = False
+from OpenGL import GL, GLUT  # noqa: E402
+
+# Position of the first trace on the canvas
+_TRACE_X_OFFSET = 150
+_TRACE_Y_OFFSET = 300
+
+# RGB values of the colors that the traces will loop through
+_TRACE_COLORS = [
+    (1.0, 0.0, 0.0),
+    (0.0, 1.0, 0.0),
+    (0.0, 0.0, 1.0),
+    (1.0, 0.0, 1.0),
+    (0.0, 1.0, 1.0)]
 
 
 class MyGLCanvas(wxcanvas.GLCanvas):
@@ -28,9 +45,15 @@ class MyGLCanvas(wxcanvas.GLCanvas):
     --------------
     init_gl(self): Configures the OpenGL context.
 
+    set_view(self): Configures the viewport, projection and modelview matrices.
+
     draw_canvas(self): Iterates through each trace and draws it on the canvas with an offset.
 
-    draw_trace(self, signal, x_pos, y_pos, label, color: tuple): Draws trace with axes and ticks.
+    draw_trace(self, signal, x_pos, y_pos, label, color: tuple, vertices): Draws trace with axes and ticks.
+
+    get_trace_vertices(signal, x_pos, y_pos): Returns the array of vertices drawing a trace.
+
+    compute_trace_vertices(self): Computes the vertices of every trace.
 
     render(self): Handles all drawing operations.
 
@@ -44,22 +67,54 @@ class MyGLCanvas(wxcanvas.GLCanvas):
 
     on_size(self, event): Handles the canvas resize event.
 
+    on_erase_background(self, event): Handles the erase background event.
+
+    on_destroy(self, event): Handles the canvas destroy event.
+
     on_mouse(self, event): Handles mouse events.
 
     render_text(self, text, x_pos, y_pos, small: bool): Handles text drawing operations.
 
+    set_color(self, red, green, blue): Sets the drawing colour if it has changed.
+
+    get_font_lists(self, small: bool): Returns the base of the display lists drawing each ASCII character in the font.
+
     update_arguments(self, devices, monitors): Update the devices and monitors with new arguments.
     """
 
+    # OpenGL context shared by all canvases, created with the first canvas
+    _shared_context = None
+
+    # Whether GLUT has been initialised by a previous canvas
+    _glut_initialised = False
+
+    # Canvas display lists released by destroyed canvases, to be reused by
+    # new canvases instead of generating more lists in the shared context
+    _spare_canvas_lists = []
+
+    # Canvas whose view and colour were last set in the shared context
+    _context_canvas = None
+
+    # Base of the display lists drawing the characters of each font, keyed
+    # by whether the font is small. The lists belong to the shared context,
+    # so they are compiled once for all canvases
+    font_lists = {}
+
     def __init__(self, parent, devices, monitors, current_time=None):
         """Initialise canvas properties and useful variables."""
         super().__init__(parent, -1,
                          attribList=[wxcanvas.WX_GL_RGBA,
                                      wxcanvas.WX_GL_DOUBLEBUFFER,
-                                     wxcanvas.WX_GL_DEPTH_SIZE, 16, 0])
-        GLUT.glutInit()
+                                     wxcanvas.WX_GL_DEPTH_SIZE, 16, 0],
+                         style=wx.NO_FULL_REPAINT_ON_RESIZE)
+        if not MyGLCanvas._glut_initialised:
+            GLUT.glutInit()
+            MyGLCanvas._glut_initialised = True
         self.init = False
-        self.context = wxcanvas.GLContext(self)
+        self.view_outdated = True
+        if MyGLCanvas._shared_context is None:
+            MyGLCanvas._shared_context = wxcanvas.GLContext(self)
+        self.context = MyGLCanvas._shared_context
 
         # Initialise variables for panning
         self.pan_x = 0
@@ -73,12 +128,24 @@ class MyGLCanvas(wxcanvas.GLCanvas):
         # Bind events to the canvas
         self.Bind(wx.EVT_PAINT, self.on_paint)
         self.Bind(wx.EVT_SIZE, self.on_size)
+        self.Bind(wx.EVT_ERASE_BACKGROUND, self.on_erase_background)
+        self.Bind(wx.EVT_WINDOW_DESTROY, self.on_destroy)
         self.Bind(wx.EVT_MOUSE_EVENTS, self.on_mouse)
         self.Bind(wx.EVT_RIGHT_DOWN, self.on_right_click)
 
         # Initialise trace objects
         self.traces = monitors.get_signals_for_GUI()
         self.y_spacing = 80
+        self.compute_trace_vertices()
+
+        # Display list drawing every trace, and whether it was compiled for a
+        # zoom of at least 1 (None until it is compiled for the current
+        # traces)
+        self.canvas_list = None
+        self.canvas_list_zoomed_in = None
+
+        # Last colour set with set_color (None if it is unknown)
+        self.gl_color = None
 
         # Initialise instance attributes
         self.devices = devices
@@ -93,10 +160,18 @@ class MyGLCanvas(wxcanvas.GLCanvas):
 
     def init_gl(self):
         """Configure and initialise the OpenGL context."""
-        size = self.GetClientSize()
         self.SetCurrent(self.context)
         GL.glDrawBuffer(GL.GL_BACK)
         GL.glClearColor(1.0, 1.0, 1.0, 0.0)
+        self.gl_color = None
+
+    def set_view(self):
+        """Configure the viewport, projection and modelview matrices.
+
+        The view depends on the canvas size, pan and zoom, so this is called
+        whenever one of them changes.
+        """
+        size = self.GetClientSize()
         GL.glViewport(0, 0, size.width, size.height)
         GL.glMatrixMode(GL.GL_PROJECTION)
         GL.glLoadIdentity()
@@ -111,49 +186,39 @@ class MyGLCanvas(wxcanvas.GLCanvas):
 
     def draw_canvas(self):
         """Iterates through each trace and draws it on the canvas with an offset."""
-        # Initialise offset parameters for each canvas instance
-        x_offset = 150
-        y_offset = 300
-
-        # RGB values of the colors that the traces will loop through
-        color_list = [
-            (1.0, 0.0, 0.0),
-            (0.0, 1.0, 0.0),
-            (0.0, 0.0, 1.0),
-            (1.0, 0.0, 1.0),
-            (0.0, 1.0, 1.0)]
+        y_offset = _TRACE_Y_OFFSET
+        GL.glLineWidth(3.0)
 
         # Iterate through each trace in self.traces and draw on canvas
         for i, trace in enumerate(self.traces):
             signal = trace[1]
             label = trace[0]
-            color = color_list[i % len(color_list)]
-            self.draw_trace(signal, x_offset, y_offset, label, color)
+            color = _TRACE_COLORS[i % len(_TRACE_COLORS)]
+            self.draw_trace(signal, _TRACE_X_OFFSET, y_offset, label, color,
+                            self.trace_vertices[i])
             y_offset -= self.y_spacing
 
-    def draw_trace(self, signal, x_pos, y_pos, label, color=(0.0, 0.0, 1.0)):
-        """Draws trace with axes and ticks."""
+    def draw_trace(self, signal, x_pos, y_pos, label, color=(0.0, 0.0, 1.0),
+                   vertices=None):
+        """Draws trace with axes and ticks.
 
-        # draw trace
-        GL.glLineWidth(3.0)
-        GL.glColor3f(*color)
-        GL.glBegin(GL.GL_LINE_STRIP)
-        for i, signal_value in enumerate(signal):
-            x = (i * 20) + x_pos
-            x_next = (i * 20) + x_pos + 20
-            if signal_value == 0 or signal_value == 1:
-                GL.glColor3f(*color)
-                y = y_pos + (25 * signal_value)
-                GL.glVertex2f(x, y)
-                GL.glVertex2f(x_next, y)
-                GL.glVertex2f(x, y)
-                GL.glVertex2f(x_next, y)
+        The vertices of the trace are computed from the signal unless they
+        are given.
+        """
+        if vertices is None:
+            vertices = self.get_trace_vertices(signal, x_pos, y_pos)
 
-        GL.glEnd()
+        # draw trace with a single call on the array of its vertices
+        if vertices:
+            self.set_color(*color)
+            GL.glEnableClientState(GL.GL_VERTEX_ARRAY)
+            GL.glVertexPointer(2, GL.GL_FLOAT, 0, vertices)
+            GL.glDrawArrays(GL.GL_LINE_STRIP, 0, len(vertices) // 2)
+            GL.glDisableClientState(GL.GL_VERTEX_ARRAY)
 
         # draw axis
         y_pos -= 10
-        GL.glColor3f(0.0, 0.0, 0.0)  # black
+        self.set_color(0.0, 0.0, 0.0)  # black
         GL.glBegin(GL.GL_LINES)
         GL.glVertex2f(x_pos, y_pos)
         GL.glVertex2f(x_pos, y_pos + 40)
@@ -161,13 +226,9 @@ class MyGLCanvas(wxcanvas.GLCanvas):
         GL.glVertex2f(x_pos + (len(signal) * 20), y_pos)
         GL.glEnd()
 
-        # draw axis ticks
+        # draw axis tick labels
         for i in range(len(signal) + 1):
             x = (i * 20) + x_pos
-            GL.glColor3f(0.0, 0.0, 0.0)  # black
-            GL.glBegin(GL.GL_LINES)
-            GL.glVertex2f(x_pos, y_pos)
-            GL.glEnd()
 
             # Render sizes
             if self.zoom >= 1:
@@ -181,19 +242,73 @@ class MyGLCanvas(wxcanvas.GLCanvas):
         x_pos -= int(40 / 3 * len(label))
         self.render_text(label, x_pos, y_pos + 18)
 
+    @staticmethod
+    def get_trace_vertices(signal, x_pos, y_pos):
+        """Return the array of vertices drawing a trace as a line strip.
+
+        Each cycle with a defined signal value adds a horizontal segment at
+        the height of its value.
+        """
+        coordinates = []
+        for i, signal_value in enumerate(signal):
+            if signal_value == 0 or signal_value == 1:
+                x = (i * 20) + x_pos
+                y = y_pos + (25 * signal_value)
+                coordinates.extend((x, y, x + 20, y))
+        return (GL.GLfloat * len(coordinates))(*coordinates)
+
+    def compute_trace_vertices(self):
+        """Compute the vertices of every trace.
+
+        The vertices only change with the traces, so they are not recomputed
+        when the canvas is panned, zoomed or resized.
+        """
+        self.trace_vertices = [
+            self.get_trace_vertices(
+                signal, _TRACE_X_OFFSET, _TRACE_Y_OFFSET - i * self.y_spacing)
+            for i, (label, signal) in enumerate(self.traces)]
+
     def render(self):
         """Handle all drawing operations."""
         self.SetCurrent(self.context)
         if not self.init:
-            # Configure the viewport, modelview and projection matrices
             self.init_gl()
             self.init = True
+        # The matrices and colour are context state, so they may have been
+        # changed by another canvas drawing through the shared context
+        if MyGLCanvas._context_canvas is not self:
+            MyGLCanvas._context_canvas = self
+            self.view_outdated = True
+            self.gl_color = None
+        if self.view_outdated:
+            # Configure the viewport, modelview and projection matrices
+            self.set_view()
+            self.view_outdated = False
 
         # Clear everything
         GL.glClear(GL.GL_COLOR_BUFFER_BIT)
 
-        # Draw signal traces
-        self.draw_canvas()
+        # Draw signal traces from the display list, only recompiling it when
+        # the traces or the tick labels shown at this zoom have changed
+        zoomed_in = self.zoom >= 1
+        if self.canvas_list_zoomed_in != zoomed_in:
+            if self.canvas_list is None:
+                if MyGLCanvas._spare_canvas_lists:
+                    self.canvas_list = MyGLCanvas._spare_canvas_lists.pop()
+                else:
+                    self.canvas_list = GL.glGenLists(1)
+
+            # Display lists cannot be compiled while compiling another one
+            self.get_font_lists(small=False)
+            self.get_font_lists(small=True)
+
+            # The colour is unknown when the display list starts
+            GL.glNewList(self.canvas_list, GL.GL_COMPILE)
+            self.gl_color = None
+            self.draw_canvas()
+            GL.glEndList()
+            self.canvas_list_zoomed_in = zoomed_in
+        GL.glCallList(self.canvas_list)
 
         # We have been drawing to the back buffer, flush the graphics pipeline
         # and swap the back buffer to the front
@@ -206,21 +321,13 @@ class MyGLCanvas(wxcanvas.GLCanvas):
 
     def recenter_canvas(self):
         """Translates and re-zooms the canvas to where it started."""
-        size = self.GetClientSize()
-
         # Reset canvas attributes
         self.pan_x = 0
         self.pan_y = 0
         self.zoom = 1.0
 
-        # Adjust the translation values for panning and centering
-        GL.glMatrixMode(GL.GL_MODELVIEW)
-        GL.glLoadIdentity()
-        GL.glTranslated(self.pan_x, self.pan_y + size.height /
-                        2 - self.y_spacing * (len(self.traces) - 1), 0.0)
-        GL.glScaled(self.zoom, self.zoom, self.zoom)
-
-        self.init = False
+        # The view is reconfigured on the next paint event
+        self.view_outdated = True
 
         self.Refresh()
 
@@ -236,23 +343,40 @@ class MyGLCanvas(wxcanvas.GLCanvas):
 
     def on_paint(self, event):
         """Handle the paint event."""
-        self.SetCurrent(self.context)
-        if not self.init:
-            # Configure the viewport, modelview and projection matrices
-            self.init_gl()
-            self.init = True
-
+        # render makes the context current and configures it if needed
         self.render()
 
     def on_size(self, event):
         """Handle the canvas resize event."""
         # Forces reconfiguration of the viewport, modelview and projection
-        # matrices on the next paint event
-        self.init = False
+        # matrices on the next paint event. The whole canvas is repainted, as
+        # the traces are centred on its height
+        self.view_outdated = True
+        self.Refresh(eraseBackground=False)
+
+    def on_erase_background(self, event):
+        """Handle the erase background event.
+
+        The event is not skipped, as every paint event clears and redraws the
+        whole canvas through OpenGL anyway.
+        """
+
+    def on_destroy(self, event):
+        """Handle the canvas destroy event.
+
+        The display list of the canvas belongs to the shared context, which
+        outlives the canvas, so it is kept for the next canvas to reuse.
+        """
+        if event.GetEventObject() is self:
+            if self.canvas_list is not None:
+                MyGLCanvas._spare_canvas_lists.append(self.canvas_list)
+                self.canvas_list = None
+            if MyGLCanvas._context_canvas is self:
+                MyGLCanvas._context_canvas = None
+        event.Skip()
 
     def on_mouse(self, event):
         """Handle mouse events."""
-        text = ""
         # Calculate object coordinates of the mouse position
         size = self.GetClientSize()
         ox = (event.GetX() - self.pan_x) / self.zoom
@@ -270,44 +394,73 @@ class MyGLCanvas(wxcanvas.GLCanvas):
 
             self.last_mouse_x = event.GetX()
             self.last_mouse_y = event.GetY()
-            self.init = False
+            self.view_outdated = True
         if event.GetWheelRotation() < 0:
             self.zoom *= (1.0 + (
                 event.GetWheelRotation() / (20 * event.GetWheelDelta())))
             # Adjust pan so as to zoom around the mouse position
             self.pan_x -= (self.zoom - old_zoom) * ox
             self.pan_y -= (self.zoom - old_zoom) * oy
-            self.init = False
+            self.view_outdated = True
         if event.GetWheelRotation() > 0:
             self.zoom /= (1.0 - (
                 event.GetWheelRotation() / (20 * event.GetWheelDelta())))
             # Adjust pan so as to zoom around the mouse position
             self.pan_x -= (self.zoom - old_zoom) * ox
             self.pan_y -= (self.zoom - old_zoom) * oy
-            self.init = False
-        self.Refresh()  # triggers the paint event
+            self.view_outdated = True
+
+        # Only repaint when the view has changed, so plain mouse movement
+        # over the canvas does not redraw it
+        if self.view_outdated:
+            self.Refresh()  # triggers the paint event
 
     def render_text(self, text, x_pos, y_pos, small=False):
         """Handle text drawing operations."""
-        GL.glColor3f(0.0, 0.0, 0.0)  # text is black
-        GL.glRasterPos2f(x_pos, y_pos)
-        if small:
-            font = GLUT.GLUT_BITMAP_HELVETICA_12
-        else:
-            font = GLUT.GLUT_BITMAP_HELVETICA_18
-
-        for character in text:
-            if character == '\n':
-                y_pos = y_pos - 20
-                GL.glRasterPos2f(x_pos, y_pos)
+        self.set_color(0.0, 0.0, 0.0)  # text is black
+        GL.glListBase(self.get_font_lists(small))
+
+        # Draw each line of text with a single call to the display lists
+        for line in text.split("\n"):
+            GL.glRasterPos2f(x_pos, y_pos)
+            if line:
+                GL.glCallLists(line.encode("ascii", "replace"))
+            y_pos = y_pos - 20
+
+    def set_color(self, red, green, blue):
+        """Set the drawing colour, skipping the call if it has not changed."""
+        color = (red, green, blue)
+        if color != self.gl_color:
+            GL.glColor3f(red, green, blue)
+            self.gl_color = color
+
+    def get_font_lists(self, small=False):
+        """Return the base of the display lists drawing each ASCII character.
+
+        The display lists are compiled the first time each font is used.
+        """
+        base = self.font_lists.get(small)
+        if base is None:
+            if small:
+                font = GLUT.GLUT_BITMAP_HELVETICA_12
             else:
-                GLUT.glutBitmapCharacter(font, ord(character))
+                font = GLUT.GLUT_BITMAP_HELVETICA_18
+
+            base = GL.glGenLists(128)
+            for character_code in range(128):
+                GL.glNewList(base + character_code, GL.GL_COMPILE)
+                GLUT.glutBitmapCharacter(font, character_code)
+                GL.glEndList()
+            self.font_lists[small] = base
+        return base
 
     def update_arguments(self, devices, monitors):
         """Update the devices and monitors with new arguments."""
         self.devices = devices
         self.monitors = monitors
         self.traces = self.monitors.get_signals_for_GUI()
+        self.compute_trace_vertices()
+        self.canvas_list_zoomed_in = None
 
         # Trigger a redraw
         self.Refresh()
@@ -107,10 +107,10 @@ class Monitors:
 
         This function is called at every simulation cycle.
         """
-        for device_id, output_id in self.monitors_dictionary:
-            signal_level = self.get_monitor_signal(device_id, output_id)
-            self.monitors_dictionary[(device_id,
-                                      output_id)].append(signal_level)
+        for (device_id, output_id), signal_list in \
+                self.monitors_dictionary.items():
+            signal_list.append(
+                self.network.get_output_signal(device_id, output_id))
 
     def get_signal_names(self):
         """Return two signal name lists: monitored and not monitored."""
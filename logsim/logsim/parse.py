@@ -110,6 +110,9 @@ class Parser:
         # Count number of errors
         self.error_count = 0
 
+        # List of error messages reported whilst parsing
+        self.parse_errors = []
+
         # List of syntax errors
         self.syntax_errors = [
             self.NO_DEVICES_KEYWORD,
@@ -186,178 +189,169 @@ class Parser:
         print(f"\n  Line {symbol.line_number}:", end=" ")
         if error_type == self.NO_DEVICES_KEYWORD:
             # Syntax error.
-            print("Expected the keyword DEVICES", end="\n \n")
+            message = "Expected the keyword DEVICES"
         elif error_type == self.NO_CONNECTIONS_KEYWORD:
             # Syntax error
-            print("Expected the keyword CONNECTIONS", end="\n \n")
+            message = "Expected the keyword CONNECTIONS"
         elif error_type == self.NO_MONITORS_KEYWORD:
             # Syntax error
-            print("Expected the keyword MONITORS", end="\n \n")
+            message = "Expected the keyword MONITORS"
         elif error_type == self.NO_END_KEYWORD:
             # Syntax error
-            print(
-                "Expected the keyword END straight after monitors list",
-                end="\n \n")
+            message = (
+                "Expected the keyword END straight after monitors list")
         elif error_type == self.NO_BRACE_OPEN:
             # Syntax error
-            print("Expected a '{' symbol", end="\n \n")
+            message = "Expected a '{' symbol"
         elif error_type == self.NO_BRACE_CLOSE:
             # Syntax error
-            print("Expected a '}' symbol", end="\n \n")
+            message = "Expected a '}' symbol"
         elif error_type == self.INVALID_NAME:
             # Syntax error
-            print("Invalid user name entered", end="\n \n")
+            message = "Invalid user name entered"
         elif error_type == self.NO_EQUALS:
             # Syntax error
-            print("Expected an '=' symbol", end="\n \n")
+            message = "Expected an '=' symbol"
         elif error_type == self.INVALID_COMPONENT:
             # Syntax error
-            print("Invalid component name entered", end="\n \n")
+            message = "Invalid component name entered"
         elif error_type == self.NO_BRACKET_OPEN:
             # Syntax error
-            print("Expected a '(' for an input", end="\n \n")
+            message = "Expected a '(' for an input"
         elif error_type == self.NO_BRACKET_CLOSE:
             # Syntax error
-            print("Expected a ')' for an input", end="\n \n")
+            message = "Expected a ')' for an input"
         elif error_type == self.NO_NUMBER:
             # Syntax error
-            print("Expected a positive integer", end="\n \n")
+            message = "Expected a positive integer"
         elif error_type == self.INPUT_OUT_OF_RANGE:
             # Semantic error
-            print(
-                "Input number of gates is out of range. Must be an integer between 1 and 16",
-                end="\n \n")
+            message = (
+                "Input number of gates is out of range. Must be an integer between 1 and 16")
         elif error_type == self.CLK_OUT_OF_RANGE:
             # Semantic error
-            print(
-                "Input clock half period is out of range. Must be a positive integer",
-                end="\n \n")
+            message = (
+                "Input clock half period is out of range. Must be a positive integer")
         elif error_type == self.BINARY_NUMBER_OUT_OF_RANGE:
             # Semantic error
-            print(
-                "Input number is out of range. Must be either 1 or 0",
-                end="\n \n")
+            message = (
+                "Input number is out of range. Must be either 1 or 0")
         elif error_type == self.UNDEFINED_NAME:
             # Syntax error
-            print("Undefined device name given", end="\n \n")
+            message = "Undefined device name given"
         elif error_type == self.NO_FULLSTOP:
             # Syntax error
-            print("Expected a full stop", end="\n \n")
+            message = "Expected a full stop"
         elif error_type == self.NO_SEMICOLON:
             # Syntax error
-            print("Expected a semicolon", end="\n \n")
+            message = "Expected a semicolon"
         elif error_type == self.NO_Q_OR_QBAR:
             # Syntax error
-            print("Expected a Q or QBAR after the full stop", end="\n \n")
+            message = "Expected a Q or QBAR after the full stop"
         elif error_type == self.NO_INPUT_SUFFIX:
             # Syntax error
-            print("Expected a valid input suffix", end="\n \n")
+            message = "Expected a valid input suffix"
         elif error_type == self.SYMBOL_AFTER_END:
             # Syntax error
-            print(
-                "There should not be any text after the keyword END",
-                end="\n \n")
+            message = (
+                "There should not be any text after the keyword END")
         elif error_type == self.EMPTY_FILE:
             # Syntax error
-            print("Cannot parse an empty file", end="\n \n")
+            message = "Cannot parse an empty file"
         elif error_type == self.TERMINATE:
             # Syntax error
-            print(
-                "Could not find parsing point to restart, program terminated early",
-                end="\n \n")
+            message = (
+                "Could not find parsing point to restart, program terminated early")
         elif error_type == self.devices.INVALID_QUALIFIER:
             # Semantic error
-            print("Invalid device property", end="\n \n")
+            message = "Invalid device property"
         elif error_type == self.devices.NO_QUALIFIER:
             # Semantic error
-            print(
-                "Expected a device property for initialisation", end="\n \n")
+            message = (
+                "Expected a device property for initialisation")
         elif error_type == self.devices.QUALIFIER_PRESENT:
             # Semantic error
-            print(
-                "Expected no device property for this device", end="\n \n")
+            message = (
+                "Expected no device property for this device")
         elif error_type == self.devices.DEVICE_PRESENT:
             # Semantic error
-            print("Device already exists in the device list", end="\n \n")
+            message = "Device already exists in the device list"
         elif error_type == self.devices.BAD_DEVICE:
             # Semantic error
-            print("Invalid type of device", end="\n \n")
+            message = "Invalid type of device"
         elif error_type == self.network.INPUT_TO_INPUT:
             # Semantic error
-            print(
-                "Cannot connect an input port to another input port",
-                end="\n \n")
+            message = (
+                "Cannot connect an input port to another input port")
         elif error_type == self.network.OUTPUT_TO_OUTPUT:
             # Semantic error
-            print(
-                "Cannot connect an output port to another output port",
-                end="\n \n")
+            message = (
+                "Cannot connect an output port to another output port")
         elif error_type == self.network.INPUT_CONNECTED:
             # Semantic error
-            print(
-                "Cannot connect input port as it is already connected",
-                end="\n \n")
+            message = (
+                "Cannot connect input port as it is already connected")
         elif error_type == self.network.PORT_ABSENT:
             # Semantic error
-            print(
-                "Cannot make connection as specified port does not exist",
-                end="\n \n")
+            message = (
+                "Cannot make connection as specified port does not exist")
         elif error_type == self.network.DEVICE_ABSENT:
             # Semantic error
-            print(
-                "Cannot make connection as device is undefined in DEVICE list",
-                end="\n \n")
+            message = (
+                "Cannot make connection as device is undefined in DEVICE list")
         elif error_type == self.monitors.NOT_OUTPUT:
             # Semantic error
-            print(
-                "Cannot assign a monitor as specified device port is not an output port",
-                end="\n \n")
+            message = (
+                "Cannot assign a monitor as specified device port is not an output port")
         elif error_type == self.monitors.MONITOR_PRESENT:
             # Semantic error
-            print(
-                "Cannot assign more than one monitor to a single device output port",
-                end="\n \n")
+            message = (
+                "Cannot assign more than one monitor to a single device output port")
         elif error_type == self.WRONG_ORDER:
             # Syntax error
-            print(
-                "Wrong keyword entered, ensure order of lists is: DEVICES, CONNECTIONS, MONITORS, END.\n          Program terminated early as this is an error which cannot be handled.",
-                end="\n \n")
+            message = (
+                "Wrong keyword entered, ensure order of lists is: DEVICES, CONNECTIONS, MONITORS, END.\n          Program terminated early as this is an error which cannot be handled.")
         elif error_type == self.NO_COMMA:
             # Syntax error
-            print(
-                "Expected a comma", end="\n \n")
+            message = (
+                "Expected a comma")
         elif error_type == self.EMPTY_DEVICE_LIST:
             # Syntax error
-            print(
-                "Cannot parse an empty device list.\n          Program terminated early as this is an error which cannot be handled.",
-                end="\n \n")
+            message = (
+                "Cannot parse an empty device list.\n          Program terminated early as this is an error which cannot be handled.")
         elif error_type == self.EMPTY_CONNECTION_LIST:
             # Syntax error
-            print(
-                "Cannot parse an empty connections list.\n          Program terminated early as this is an error which cannot be handled.",
-                end="\n \n")
+            message = (
+                "Cannot parse an empty connections list.\n          Program terminated early as this is an error which cannot be handled.")
         elif error_type == self.RC_OUT_OF_RANGE:
             # Semantic error
-            print(
-                "Input RC period is out of range. Must be a positive integer",
-                end="\n \n")
+            message = (
+                "Input RC period is out of range. Must be a positive integer")
         elif error_type == self.NO_SIGNAL_LIST:
             # Semantic error
-            print(
-                "Siggen signal input is not valid. Must be a list of digits e.g. [1,2,5,3].",
-                end="\n \n")
+            message = (
+                "Siggen signal input is not valid. Must be a list of digits e.g. [1,2,5,3].")
         else:
             raise ValueError("Expected a valid error code")
+        print(message, end="\n \n")
+
+        # Record the error so callers (e.g. the GUI) do not need to capture
+        # the printed terminal output
+        error_message = f"Line {symbol.line_number}: {message}\n"
 
         # If at the end of file, don't display line and marker and return
         if symbol.type == self.scanner.EOF:
+            self.parse_errors.append(error_message)
             return
 
         # Display error line and visual marker if display is True
         if display:
             # Display error line and indicator (latter only if display_marker
             # is true)
-            self.scanner.display_line_and_marker(symbol)
+            line_and_marker = self.scanner.get_line_and_marker(symbol)
+            print(line_and_marker, end="")
+            error_message += line_and_marker
+        self.parse_errors.append(error_message)
         #   self.scanner.display_line_and_marker(symbol, display_marker)
 
         if proceed:
@@ -1397,14 +1391,20 @@ class Parser:
                             print(
                                 f"Missing {self.error_count} input(s): ",
                                 end="\n \n")
+                            missing_input_names = []
                             for j in range(len(missing_input_id_list)):
-                                print(
+                                missing_input_name = (
                                     self.names.get_name_string(
                                         device_missing_input_id_list[j].device_id) +
                                     "." +
                                     self.names.get_name_string(
-                                        missing_input_id_list[j]),
-                                    end="\n \n")
+                                        missing_input_id_list[j]))
+                                missing_input_names.append(missing_input_name)
+                                print(missing_input_name, end="\n \n")
+                            self.parse_errors.append(
+                                "Cannot build network as not all inputs have a valid connection\n"
+                                f"Missing {self.error_count} input(s): " +
+                                ", ".join(missing_input_names) + "\n")
 
                     # If nothing after connections list
                     if (self.symbol.type == self.scanner.EOF) and (
@@ -1431,10 +1431,11 @@ class Parser:
                 print("No errors detected ")
                 return True
             elif self.error_count == 1:
-                print("1 error detected")
-                return False
+                error_summary = "1 error detected"
             else:
                 # Display total number of errors
-                print(
+                error_summary = (
                     f"Total of {str(self.error_count)} error(s) detected")
-                return False
+            print(error_summary)
+            self.parse_errors.append(error_summary)
+            return False
@@ -53,6 +53,8 @@ class Scanner:
     display_line_and_marker(self, symbol): Takes a symbol instance and prints its line in the file with a marker underneath.
                                            If the 'name' is over length one, use tildes, otherwise use caret.
                                            Printed lines will have a standard indent of eight spaces.
+
+    get_line_and_marker(self, symbol): Takes a symbol instance and returns its line in the file with a marker underneath.
     """
 
     def __init__(self, path, names):
@@ -182,6 +184,11 @@ class Scanner:
 
     def display_line_and_marker(self, symbol, display_marker=True):
         """Takes a symbol instance and prints its line in the file with a marker
+        underneath."""
+        print(self.get_line_and_marker(symbol, display_marker), end="")
+
+    def get_line_and_marker(self, symbol, display_marker=True):
+        """Takes a symbol instance and returns its line in the file with a marker
         underneath.
 
         If the 'name' is over length one, use tildes, otherwise use caret. Printed lines
@@ -239,17 +246,13 @@ class Scanner:
             filled_marker_string[start_of_text_index:]
 
         if not display_marker:
-            # Just print line text
-            print(line_text)
-            return
+            # Just return line text
+            return line_text + "\n"
 
         if symbol.type == self.EOF:  # handle case of error in END keyword
-            print(line_text)
-            print(filled_marker_string, end="\n\n")
+            return line_text + "\n" + filled_marker_string + "\n\n"
 
-        else:
-            print(line_text, end="")
-            print(filled_marker_string, end="\n\n")
+        return line_text + filled_marker_string + "\n\n"
 
     def open_file(self, path):
         """Open and return the file specified by path."""
@@ -1306,6 +1306,94 @@ def test_parser_incorrect_file(
     assert parser.parse_network() == expected
 
 
+@pytest.mark.parametrize("example, expected", [
+    ("""
+    DEVICES{
+        and = AND(1);
+        switch = SWITCH(1)
+    }
+    CONNECTIONS{
+        and.I1 = switch;
+    }
+    MONITORS{
+        and.I1;
+    }
+    END
+    """, "Line 5: Expected a semicolon\n"),
+    ("""""", "Line 1: Cannot parse an empty file\n")
+])
+def test_parser_parse_errors(
+        parser_fixture,
+        create_testing_file_to_scan,
+        example,
+        expected):
+    """Test error messages are recorded in parse_errors as well as printed"""
+
+    scanner = create_testing_file_to_scan(
+        example, scan_through_all=False)
+
+    parser = parser_fixture(scanner)
+
+    parser.parse_network()
+
+    assert parser.parse_errors[0].startswith(expected)
+
+
+@pytest.mark.parametrize("example, expected", [
+    ("""
+    DEVICES{
+        and = AND(1);
+        switch = SWITCH(1);
+    }
+    CONNECTIONS{
+        and.I1 = switch;
+    }
+    MONITORS{
+        and;
+    }
+    """, "1 error detected"),
+    ("""
+    DEVICES{
+        and = AND(1);
+        switch = SWITCH(1)
+    }
+    CONNECTIONS{
+        and.I1 = switch;
+    }
+    MONITORS{
+        and.I1;
+    }
+    END
+    """, "Total of 2 error(s) detected")
+])
+def test_parser_parse_errors_summary(
+        parser_fixture,
+        create_testing_file_to_scan,
+        example,
+        expected):
+    """Test the error count is recorded after the error messages"""
+
+    scanner = create_testing_file_to_scan(
+        example, scan_through_all=False)
+
+    parser = parser_fixture(scanner)
+
+    assert parser.parse_network() is False
+    assert parser.parse_errors[-1] == expected
+
+
+def test_parser_no_parse_errors(names_fixture, parser_fixture):
+    """Test no error messages are recorded for a correct file"""
+
+    path = os.path.join(
+        os.path.dirname(__file__), "example1_logic_description.txt")
+    scanner = Scanner(path, names_fixture)
+    parser = parser_fixture(scanner)
+
+    assert parser.parse_network() is True
+    assert parser.parse_errors == []
+
+
 def test_delete_testing_file():
     """This is an in-house helper function not strictly related to testing parse.py"""
     if os.path.exists("testing_file.txt"):